@@ -12,7 +12,7 @@ from pathlib import Path
 # Add the parent directory to the path to import app modules
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from app.config import settings
+from app.config import get_settings
 from app.shared.infrastructure.persistence.database import Base
 
 from app.port_management.infrastructure.models.port_model import PortModel
@@ -45,7 +45,7 @@ def get_alembic_database_url():
     Converts the async aiomysql driver to synchronous pymysql.
     """
     # Get the database URL from settings
-    db_url = str(settings.database_url())
+    db_url = str(get_settings().database_url())
 
     # Replace aiomysql with pymysql for synchronous operations
     sync_url = db_url.replace("mysql+aiomysql://", "mysql+pymysql://")
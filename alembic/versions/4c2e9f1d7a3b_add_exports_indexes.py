@@ -0,0 +1,29 @@
+"""add exports indexes
+
+Revision ID: 4c2e9f1d7a3b
+Revises: b654eb9742d1
+Create Date: 2025-11-24 10:12:41.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4c2e9f1d7a3b'
+down_revision: Union[str, Sequence[str], None] = 'b654eb9742d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_exports_user_id_id', 'exports', ['user_id', 'id'])
+    op.create_index('ix_exports_route_id', 'exports', ['optimized_route_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_exports_route_id', table_name='exports')
+    op.drop_index('ix_exports_user_id_id', table_name='exports')
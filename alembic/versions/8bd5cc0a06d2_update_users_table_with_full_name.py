@@ -9,7 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.engine.reflection import Inspector
 
 # revision identifiers, used by Alembic.
 revision: str = '8bd5cc0a06d2'
@@ -28,27 +27,25 @@ def upgrade() -> None:
     - Ensures password column exists
     """
     # Get database connection and inspector
-    bind = op.get_bind()
-    inspector = Inspector.from_engine(bind)
+    inspector = sa.inspect(op.get_bind())
 
-    # Get the list of column names in the 'users' table
+    # Get the list of column and index names in the 'users' table
     columns = [c['name'] for c in inspector.get_columns('users')]
+    indexes = {ix['name'] for ix in inspector.get_indexes('users')}
 
-    # Add a full_name column to the user's table
-    if 'full_name' not in columns:
-        # ... The original add_column code ...
-        op.add_column('users', sa.Column('full_name', sa.String(length=100), nullable=False, server_default=''))
-    
-    # Remove server_default after the column is created
-    op.alter_column('users', 'full_name', server_default=None)
-    
-    # Ensure email has a unique constraint and index
-    # (This may already exist, but we ensure it here)
-    try:
-        op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
-    except:
-        # Index may already exist, skip if it does
-        pass
+    # Group the users table changes in a single batch
+    with op.batch_alter_table('users') as batch_op:
+        # Add a full_name column to the user's table
+        if 'full_name' not in columns:
+            batch_op.add_column(sa.Column('full_name', sa.String(length=100), nullable=False, server_default=''))
+
+        # Remove server_default after the column is created
+        batch_op.alter_column('full_name', server_default=None)
+
+        # Ensure email has a unique constraint and index
+        # (This may already exist, so it is only created when missing)
+        if 'ix_users_email' not in indexes:
+            batch_op.create_index('ix_users_email', ['email'], unique=True)
 
 
 def downgrade() -> None:
@@ -61,8 +58,6 @@ def downgrade() -> None:
     op.drop_column('users', 'full_name')
     
     # Remove the index if it exists
-    try:
+    inspector = sa.inspect(op.get_bind())
+    if 'ix_users_email' in {ix['name'] for ix in inspector.get_indexes('users')}:
         op.drop_index(op.f('ix_users_email'), table_name='users')
-    except:
-        # Index may not exist, skip if it doesn't
-        pass
@@ -0,0 +1,27 @@
+"""add port_connections port ids index
+
+Revision ID: 9c4d2b7e1f58
+Revises: 4c2e9f1d7a3b
+Create Date: 2025-11-24 15:42:07.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4d2b7e1f58'
+down_revision: Union[str, Sequence[str], None] = '4c2e9f1d7a3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_port_connections_port_a_id_port_b_id', 'port_connections', ['port_a_id', 'port_b_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_port_connections_port_a_id_port_b_id', table_name='port_connections')
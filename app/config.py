@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -15,14 +17,27 @@ class Settings(BaseSettings):
     MYSQL_USER: str = "user"
     MYSQL_PASSWORD: str = "password"
     MYSQL_HOST: str = "host"
-    MYSQL_PORT: str = "port"
+    MYSQL_PORT: int = 3306
     MYSQL_DB: str = "db"
 
-    # JWT Settings
-    JWT_SECRET_KEY: str = "secret_key_huh"
+    # Connection pool settings
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_QUERY_CACHE_SIZE: int = 1200
+
+    # JWT Settings (the secret key has no default and must come from the environment)
+    JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing settings (a BCRYPT_TARGET_MS above 0 calibrates the rounds at startup)
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_TARGET_MS: int = 0
+
+    # Bulk insertion settings
+    EXPORT_BULK_BATCH_SIZE: int = 500
+
     def database_url(self) -> str:
         """
         Creates the connection string for the database.
@@ -40,5 +55,15 @@ class Settings(BaseSettings):
         env_file = "development.env"
         env_file_encoding = "utf-8"
 
-# Global instance for the Settings class
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Gets the application settings.
+
+    The settings are created on the first call, so the env file is only read when
+    they are actually needed, and the same instance is reused afterward.
+
+    :return: The cached Settings instance.
+    """
+    return Settings()
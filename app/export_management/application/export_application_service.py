@@ -1,4 +1,6 @@
-﻿from sqlalchemy.ext.asyncio import AsyncSession
+﻿from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.export_management.domain.models.export import Export
 from app.export_management.domain.services.support.export_service import ExportService
@@ -6,10 +8,13 @@ from app.export_management.infrastructure.repositories.export_repository import
 from app.route_optimization.domain.models.optimal_route import OptimalRoute
 from app.route_optimization.infrastructure.repositories.optimal_route_repository import OptimalRouteRepository
 
+# Stateless domain service shared by every ExportApplicationService instance
+_EXPORT_SERVICE = ExportService()
+
 
 class ExportApplicationService:
     def __init__(self, db: AsyncSession):
-        self.export_service = ExportService()
+        self.export_service = _EXPORT_SERVICE
         self.export_repository = ExportRepository(db)
         self.route_repository = OptimalRouteRepository(db)
 
@@ -56,19 +61,53 @@ class ExportApplicationService:
 
             await self.export_repository.create(export)
 
-        except (ValueError, TypeError):
-            raise ValueError("Invalid data format.")
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid data format: {e}")
 
         return export
 
+    async def register_exports_bulk(self, exports_data: list[dict]) -> list["Export"]:
+        """
+        Registers many exports at once and persists them in a single batch.
+
+        Every row is validated with the export service before anything is written, so
+        an invalid row aborts the whole batch without touching the repository.
+
+        :param exports_data: List of dictionaries with the same keys accepted by
+            `register_export` (comercial_description, transportation_mode, us_fob,
+            gross_weight, net_weight, unit, quantity, optimized_route_id, user_id).
+        :return: The list of created Export objects.
+        :raises ValueError: If any row is missing fields or fails validation.
+        """
+        exports: list[Export] = []
+
+        for row_number, row in enumerate(exports_data, start=1):
+            try:
+                export = self.export_service.register_export(
+                    name=row["comercial_description"],
+                    mode=row["transportation_mode"],
+                    us_fob=row["us_fob"],
+                    gross_weight=row["gross_weight"],
+                    net_weight=row["net_weight"],
+                    unit=row["unit"],
+                    quantity=row["quantity"],
+                    route_id=row["optimized_route_id"],
+                    user_id=row["user_id"]
+                )
+            except (KeyError, ValueError, TypeError) as e:
+                raise ValueError(f"Invalid data format for row number {row_number}: {e}")
+
+            exports.append(export)
+
+        return await self.export_repository.bulk_create(exports)
+
     async def assign_route_id_to_export(self, export_id: str, new_route_id: str) -> "Export | None" :
         """
         Assigns a new route ID to an existing export.
 
-        This method updates the route ID associated with an export. It retrieves
-        the export by its ID, ensures that the export exists, and then assigns the
-        new route ID to the export. After updating the export, it synchronizes the
-        change with the repository.
+        This method updates the route ID associated with an export with a single
+        UPDATE statement, ensures that the export existed, and then retrieves the
+        updated export.
 
         :param export_id: Unique identifier of the export to update.
         :param new_route_id: New route ID to assign to the export.
@@ -78,14 +117,15 @@ class ExportApplicationService:
             if export_id is None or export_id.strip() == "":
                 raise ValueError("To update an export, you must provide a valid export id.")
 
-            export = await self.export_repository.get_by_id(export_id)
+            if new_route_id is None or new_route_id.strip() == "":
+                raise ValueError("Port ID cannot be empty")
 
-            if not export:
-                raise ValueError("Export not found.")
+            updated_rows = await self.export_repository.update_route_id(export_id, new_route_id)
 
-            updated_export = self.export_service.assign_port_id_to_export(export, new_route_id)
+            if updated_rows == 0:
+                raise ValueError("Export not found.")
 
-            await self.export_repository.update(updated_export)
+            updated_export = await self.export_repository.get_by_id(export_id)
         except ValueError as e:
             raise ValueError(f"Error trying to update export: {e}")
 
@@ -144,6 +184,35 @@ class ExportApplicationService:
 
         return exports
 
+    def stream_all_exports(self) -> AsyncIterator["Export"]:
+        """
+        Stream all export records.
+
+        Unlike `get_all_exports`, the records are not collected in a list first; each
+        export is yielded as soon as it is read from the repository.
+
+        :return: An async iterator over all the export records.
+        :rtype: AsyncIterator[Export]
+        """
+        return self.export_repository.stream_all()
+
+    async def sum_fob_by_mode(self) -> dict[str, float]:
+        """
+        Retrieve the total FOB value of the exports for each transportation mode.
+
+        The totals are computed by the repository in a single grouped query instead of
+        loading every export record.
+
+        :return: A dictionary mapping each transportation mode to its total FOB value in USD.
+        :rtype: dict[str, float]
+
+        :raises ValueError: If an error occurs during the retrieval process.
+        """
+        try:
+            return await self.export_repository.sum_us_fob_by_transportation_mode()
+        except ValueError as e:
+            raise ValueError(f"Error trying to retrieve FOB totals: {e}")
+
     async def get_exports_by_user_id(self, user_id: str) -> list["Export"]:
         """
         Retrieve all export records for a specific user.
@@ -168,14 +237,38 @@ class ExportApplicationService:
         except ValueError as e:
             raise ValueError(f"Error trying to retrieve exports by user: {e}")
 
+    async def get_exports_with_routes(self, user_id: str | None = None) -> list[tuple["Export", "OptimalRoute | None"]]:
+        """
+        Retrieve export records together with their optimal routes.
+
+        The routes are loaded alongside the exports by the repository, so no additional
+        route lookup is issued per export.
+
+        :param user_id: Optional unique identifier of the user whose exports are retrieved.
+            If not provided, all exports are returned.
+        :type user_id: str | None
+        :return: A list of (export, route) pairs. The route is None if the export has no
+            optimal route assigned.
+        :rtype: list[tuple[Export, OptimalRoute | None]]
+
+        :raises ValueError: If the user id is blank or an error occurs during the retrieval process.
+        """
+        try:
+            if user_id is not None and user_id.strip() == "":
+                raise ValueError("To retrieve exports, you must provide a valid user id.")
+
+            return await self.export_repository.get_with_routes(user_id)
+        except ValueError as e:
+            raise ValueError(f"Error trying to retrieve exports with routes: {e}")
+
     async def get_route_by_export_id(self, export_id: str) -> "OptimalRoute | None":
         """
         Retrieve an optimal route based on the provided export ID.
 
-        This asynchronous method interacts with the export repository and route
-        repository to fetch the optimal route associated with a given export ID. If the
-        export ID is invalid, or if the associated export or route cannot be found, it
-        raises an appropriate error. Returns the optimal route if found, otherwise
+        This asynchronous method uses the route repository to fetch the optimal route
+        associated with a given export ID in a single query. If the export ID is
+        invalid, or if the associated route cannot be found, it raises an appropriate
+        error. Returns the optimal route if found, otherwise
         None. The method is primarily designed to work within an environment where
         both export and route data are available for retrieval.
 
@@ -192,12 +285,7 @@ class ExportApplicationService:
             if export_id is None or export_id.strip() == "":
                 raise ValueError("To retrieve a route, you must provide a valid export id.")
 
-            export = await self.export_repository.get_by_id(export_id)
-
-            if not export:
-                raise ValueError("Export not found.")
-
-            route = await self.route_repository.get_by_id(export.optimized_route_id)
+            route = await self.route_repository.get_by_export_id(export_id)
 
             if not route:
                 raise ValueError("Route not found.")
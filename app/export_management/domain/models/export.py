@@ -3,7 +3,7 @@
 from app.shared.domain.models.base_entity import BaseEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class Export(BaseEntity):
     """
     Represents an export entity with attributes describing the export details.
@@ -2,6 +2,49 @@
 Service class for managing exports in the export management context.
 """
 from app.export_management.domain.models.export import Export
+from app.shared.domain.validation import is_blank
+
+
+def _to_float(value) -> float:
+    """
+    Returns the value as a float, skipping the conversion when it already is one.
+
+    :raises ValueError: If the value cannot be converted to a float.
+    """
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid data format.")
+
+
+def _validate_text(value: str, label: str) -> None:
+    """
+    Validates that a required text field is a non-empty string.
+
+    :raises ValueError: If the value is not a string or is empty.
+    """
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{label} must be a string")
+    if is_blank(value):
+        raise ValueError(f"{label} cannot be empty")
+
+
+def _validate_export_fields(name: str, mode: str, unit: str, route_id: str, user_id: str,
+                            us_fob: float, gross_weight: float, net_weight: float, quantity: float) -> None:
+    """
+    Validates the fields of an export with one straight-line check per field.
+
+    :raises ValueError: If a required text field is not a string or is empty, or a numeric field is negative.
+    """
+    _validate_text(name, "Name")
+    _validate_text(mode, "Mode")
+    _validate_text(unit, "Unit")
+    _validate_text(route_id, "Port ID")
+    _validate_text(user_id, "User ID")
+    if min(us_fob, gross_weight, net_weight, quantity) < 0:
+        raise ValueError("US FOB, gross weight, net weight and quantity cannot be negative")
 
 
 class ExportService:
@@ -53,31 +96,12 @@ class ExportService:
         :raises ValueError: Raised if any parameter fails validation, such as empty strings,
             negative numbers, or data type mismatches.
         """
-        try:
-            gross_weight = float(gross_weight)
-            net_weight = float(net_weight)
-            quantity = float(quantity)
-            us_fob = float(us_fob)
-            if name.strip() == "":
-                raise ValueError("Name cannot be empty")
-            if mode.strip() == "":
-                raise ValueError("Mode cannot be empty")
-            if unit.strip() == "":
-                raise ValueError("Unit cannot be empty")
-            if route_id.strip() == "":
-                raise ValueError("Port ID cannot be empty")
-            if user_id.strip() == "":
-                raise ValueError("User ID cannot be empty")
-            if us_fob < 0:
-                raise ValueError("US FOB must be greater than 0")
-            if gross_weight < 0:
-                raise ValueError("Gross weight must be greater than 0")
-            if net_weight < 0:
-                raise ValueError("Net weight must be greater than 0")
-            if quantity < 0:
-                raise ValueError("Quantity must be greater than 0")
-        except (ValueError, TypeError):
-            raise ValueError("Invalid data format.")
+        us_fob = _to_float(us_fob)
+        gross_weight = _to_float(gross_weight)
+        net_weight = _to_float(net_weight)
+        quantity = _to_float(quantity)
+
+        _validate_export_fields(name, mode, unit, route_id, user_id, us_fob, gross_weight, net_weight, quantity)
 
         return Export(
             comercial_description=name,
@@ -109,11 +133,10 @@ class ExportService:
         :rtype: Export
         :raises ValueError: If the port ID is empty or invalid.
         """
-        try:
-            if port_id.strip() == "":
-                raise ValueError("Port ID cannot be empty")
-        except (ValueError, TypeError):
+        if not isinstance(port_id, str):
             raise ValueError("Invalid data format.")
+        if not port_id.strip():
+            raise ValueError("Port ID cannot be empty")
 
         export.optimized_route_id = port_id
         return export
\ No newline at end of file
@@ -1,4 +1,4 @@
-﻿from sqlalchemy import Column, String, Float, ForeignKey
+﻿from sqlalchemy import Column, String, Float, ForeignKey, Index
 from sqlalchemy.orm import Mapped, relationship
 
 from app.shared.infrastructure.models.base_model import BaseModelORM
@@ -31,6 +31,10 @@ class ExportModel(BaseModelORM):
     :type optimized_route_id: str
     """
     __tablename__ = "exports"
+    __table_args__ = (
+        Index("ix_exports_user_id_id", "user_id", "id"),
+        Index("ix_exports_route_id", "optimized_route_id"),
+    )
 
     comercial_description: Mapped[str] = Column(String(255), nullable=False)
     transportation_mode: Mapped[str] = Column(String(255), nullable=False)
@@ -1,7 +1,16 @@
-﻿from sqlalchemy.ext.asyncio import AsyncSession
+﻿from dataclasses import asdict
+from datetime import datetime
+from typing import AsyncIterator
 
+from sqlalchemy import insert, select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.config import get_settings
 from app.export_management.domain.models.export import Export
 from app.export_management.infrastructure.models.export_model import ExportModel
+from app.route_optimization.domain.models.optimal_route import OptimalRoute
+from app.route_optimization.infrastructure.repositories.optimal_route_repository import OptimalRouteRepository
 from app.shared.infrastructure.repositories.base_repository import BaseRepository, TEntity, TModel
 
 
@@ -13,6 +22,7 @@ class ExportRepository(BaseRepository[Export, ExportModel]):
         :param db: The database session.
         """
         super().__init__(db, ExportModel)
+        self._route_repository = OptimalRouteRepository(db)
 
     def to_model(self, entity: Export) -> "ExportModel":
         """
@@ -66,16 +76,141 @@ class ExportRepository(BaseRepository[Export, ExportModel]):
 
     async def get_by_user_id(self, user_id: str) -> list["Export"]:
         """
-        Retrieves all exports associated with a specific user.
+        Retrieves all exports associated with a specific user, ordered by id so the
+        `(user_id, id)` index covers both the filter and the ordering.
 
         :param user_id: The unique identifier of the user.
         :type user_id: str
         :return: A list of Export entities belonging to the specified user.
         :rtype: list[Export]
         """
-        from sqlalchemy import select
         result = await self._db.execute(
-            select(ExportModel).where(ExportModel.user_id == user_id)
+            select(ExportModel)
+            .where(ExportModel.user_id == user_id)
+            .order_by(ExportModel.id)
         )
         models = result.scalars().all()
-        return [self.to_entity(model) for model in models]
\ No newline at end of file
+        return [self.to_entity(model) for model in models]
+
+    async def stream_all(self) -> AsyncIterator["Export"]:
+        """
+        Streams all exports one at a time instead of loading the whole table in memory.
+
+        The rows are read through a server-side cursor, so each `Export` entity is yielded
+        as soon as its row arrives.
+
+        :return: An async iterator over all the Export entities.
+        :rtype: AsyncIterator[Export]
+        """
+        result = await self._db.stream_scalars(select(ExportModel))
+        async for model in result:
+            yield self.to_entity(model)
+
+    async def get_with_routes(self, user_id: str | None = None) -> list[tuple["Export", "OptimalRoute | None"]]:
+        """
+        Retrieves exports together with their optimized routes.
+
+        The routes are eagerly loaded with `selectinload`, so the whole listing takes two
+        queries (one for the exports and one for their routes) instead of one extra query
+        per export.
+
+        :param user_id: Optional unique identifier of a user to filter the exports by.
+        :type user_id: str | None
+        :return: A list of (export, route) pairs. The route is None when the export has
+            no optimized route.
+        :rtype: list[tuple[Export, OptimalRoute | None]]
+        """
+        query = select(ExportModel).options(selectinload(ExportModel.optimized_route))
+        if user_id is not None:
+            query = query.where(ExportModel.user_id == user_id)
+
+        result = await self._db.execute(query)
+        return [
+            (
+                self.to_entity(model),
+                self._route_repository.to_entity(model.optimized_route) if model.optimized_route else None
+            )
+            for model in result.scalars().all()
+        ]
+
+    async def bulk_create(self, entities: list[Export]) -> list["Export"]:
+        """
+        Persists many exports using multi-row INSERT statements and a single commit.
+
+        The entities are inserted in chunks of `EXPORT_BULK_BATCH_SIZE` rows, so each
+        chunk is sent to the database as one statement instead of one INSERT per row.
+
+        :param entities: The list of `Export` entities to be persisted.
+        :type entities: list[Export]
+        :return: The persisted `Export` entities.
+        :rtype: list[Export]
+        """
+        if not entities:
+            return []
+
+        batch_size = max(1, get_settings().EXPORT_BULK_BATCH_SIZE)
+        rows = [asdict(entity) for entity in entities]
+
+        for start in range(0, len(rows), batch_size):
+            await self._db.execute(insert(ExportModel), rows[start:start + batch_size])
+
+        await self._db.commit()
+        return entities
+
+    async def get_columns(self, columns: list[str]) -> list[tuple]:
+        """
+        Retrieves only the requested columns of every export as plain row tuples.
+
+        This skips building an `Export` entity per row, which is useful when a caller
+        only needs a few values (e.g., to aggregate or chart them).
+
+        :param columns: The names of the `ExportModel` columns to select.
+        :type columns: list[str]
+        :return: A list of tuples with the values of the requested columns, in order.
+        :rtype: list[tuple]
+        :raises ValueError: If a column name does not belong to the exports table.
+        """
+        table_columns = ExportModel.__table__.columns
+        unknown_columns = [column for column in columns if column not in table_columns]
+        if not columns or unknown_columns:
+            raise ValueError(f"Invalid export columns: {unknown_columns or columns}")
+
+        result = await self._db.execute(
+            select(*[table_columns[column] for column in columns])
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def sum_us_fob_by_transportation_mode(self) -> dict[str, float]:
+        """
+        Sums the FOB value of the exports grouped by transportation mode.
+
+        The aggregation runs in the database, so only one row per transportation mode
+        is returned.
+
+        :return: A dictionary mapping each transportation mode to its total FOB value in USD.
+        :rtype: dict[str, float]
+        """
+        result = await self._db.execute(
+            select(ExportModel.transportation_mode, func.sum(ExportModel.us_fob))
+            .group_by(ExportModel.transportation_mode)
+        )
+        return {mode: float(total or 0) for mode, total in result.all()}
+
+    async def update_route_id(self, export_id: str, new_route_id: str) -> int:
+        """
+        Updates the optimized route of an export with a single UPDATE statement.
+
+        :param export_id: The unique identifier of the export to update.
+        :type export_id: str
+        :param new_route_id: The identifier of the route to assign.
+        :type new_route_id: str
+        :return: The number of updated rows (0 if the export does not exist).
+        :rtype: int
+        """
+        result = await self._db.execute(
+            update(ExportModel)
+            .where(ExportModel.id == export_id)
+            .values(optimized_route_id=new_route_id, updated_at=datetime.now())
+        )
+        await self._db.commit()
+        return result.rowcount
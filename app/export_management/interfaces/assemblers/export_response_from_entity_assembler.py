@@ -7,7 +7,9 @@ def assemble_export_response_from_entity(entity: Export) -> "ExportResponse":
     Transforms an Export entity into an ExportResponse object.
 
     This function takes an Export entity and converts its attributes into an
-    ExportResponse object, ensuring proper serialization where required.
+    ExportResponse object, ensuring proper serialization where required. The data
+    comes from the domain layer, which already validated it, so the model is built
+    with `model_construct` to skip Pydantic validation.
 
     :param entity: The Export entity to transform.
     :type entity: Export
@@ -16,7 +18,7 @@ def assemble_export_response_from_entity(entity: Export) -> "ExportResponse":
         Export entity.
     :rtype: ExportResponse
     """
-    return ExportResponse(
+    return ExportResponse.model_construct(
         id=entity.id,
         comercial_description=entity.comercial_description,
         transportation_mode=entity.transportation_mode,
@@ -27,5 +29,34 @@ def assemble_export_response_from_entity(entity: Export) -> "ExportResponse":
         quantity=entity.quantity,
         optimized_route_id=entity.optimized_route_id,
         user_id=entity.user_id,
-        created_at=entity.created_at.isoformat()
-    )
\ No newline at end of file
+        created_at=entity.created_at
+    )
+
+
+def assemble_export_dict_from_entity(entity: Export) -> dict:
+    """
+    Transforms an Export entity into a plain dictionary with the ExportResponse fields.
+
+    This skips the construction and validation of an ExportResponse object, so it is
+    meant for endpoints that serialize the result directly with orjson, which also
+    encodes the `created_at` datetime natively.
+
+    :param entity: The Export entity to transform.
+    :type entity: Export
+
+    :return: A dictionary with the same keys and values as an ExportResponse.
+    :rtype: dict
+    """
+    return {
+        "id": entity.id,
+        "comercial_description": entity.comercial_description,
+        "transportation_mode": entity.transportation_mode,
+        "us_fob": entity.us_fob,
+        "gross_weight": entity.gross_weight,
+        "net_weight": entity.net_weight,
+        "unit": entity.unit,
+        "quantity": entity.quantity,
+        "optimized_route_id": entity.optimized_route_id,
+        "user_id": entity.user_id,
+        "created_at": entity.created_at
+    }
@@ -1,14 +1,15 @@
 ﻿from typing import Annotated, Any
 
+import orjson
 from fastapi import APIRouter, Depends, status, Path
 from fastapi.openapi.models import Example
 from fastapi.params import Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.export_management.application.export_application_service import ExportApplicationService
 from app.export_management.interfaces.assemblers.export_response_from_entity_assembler import \
-    assemble_export_response_from_entity
+    assemble_export_dict_from_entity
 from app.export_management.interfaces.schemas.requests.export_request import ExportRequest
 from app.export_management.interfaces.schemas.responses.export_response import ExportResponse
 from app.iam.domain.models.user import User
@@ -24,7 +25,7 @@ def get_export_app_service(db: AsyncSession = Depends(get_db)) -> "ExportApplica
     return ExportApplicationService(db)
 
 
-@router.get("", response_model=list[ExportResponse], status_code=status.HTTP_200_OK)
+@router.get("", responses={status.HTTP_200_OK: {"model": list[ExportResponse]}}, status_code=status.HTTP_200_OK)
 async def get_exports(
         user_id: str | None = Query(None, description="Filter exports by user ID"),
         current_user: User = Depends(get_current_user),
@@ -35,6 +36,8 @@ async def get_exports(
 
     This endpoint fetches export records. If a user_id query parameter is provided,
     it returns only exports belonging to that user. Otherwise, it returns all exports.
+    The list is serialized directly with orjson instead of building and validating an
+    ExportResponse per record.
 
     :param user_id: Optional user ID to filter exports. If not provided, returns all exports.
     :param current_user: The authenticated user making the request.
@@ -50,8 +53,7 @@ async def get_exports(
         if not exports:
             return []
 
-        export_responses = [assemble_export_response_from_entity(export) for export in exports]
-        return export_responses
+        return ORJSONResponse(content=[assemble_export_dict_from_entity(export) for export in exports])
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -59,7 +61,29 @@ async def get_exports(
         )
 
 
-@router.get("/{export_id}", response_model=ExportResponse, status_code=status.HTTP_200_OK)
+@router.get("/stream", status_code=status.HTTP_200_OK)
+async def stream_exports(
+        current_user: User = Depends(get_current_user),
+        export_app_service: ExportApplicationService = Depends(get_export_app_service)
+) -> StreamingResponse:
+    """
+    Streams all exports as newline-delimited JSON (NDJSON).
+
+    Each export is encoded and sent as soon as it is read from the database, so memory
+    usage stays constant regardless of the number of exports.
+
+    :param current_user: The authenticated user making the request.
+    :param export_app_service: The dependency-injected export application service.
+    :return: A streaming response with one export per line.
+    """
+    return StreamingResponse(
+        (orjson.dumps(assemble_export_dict_from_entity(export)) + b"\n"
+         async for export in export_app_service.stream_all_exports()),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/{export_id}", responses={status.HTTP_200_OK: {"model": ExportResponse}}, status_code=status.HTTP_200_OK)
 async def get_export_by_id(
         export_id: Annotated[str, Path(
             title="The ID of the port to get",
@@ -87,7 +111,7 @@ async def get_export_by_id(
     Handles a GET request to fetch an export record by its unique identifier.
 
     This endpoint retrieves the details of an export record from the service based on
-    the provided `export_id`. The record is returned as a response model. If no record
+    the provided `export_id`. The record is serialized directly with orjson. If no record
     is found or an error occurs during processing, appropriate error responses are returned.
 
     :param export_id: The unique identifier of the export record to retrieve. Must be a valid
@@ -105,8 +129,7 @@ async def get_export_by_id(
                 content={"error": "Export for given id not found"}
             )
 
-        export_response = assemble_export_response_from_entity(export)
-        return export_response
+        return ORJSONResponse(content=assemble_export_dict_from_entity(export))
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -114,7 +137,7 @@ async def get_export_by_id(
         )
 
 
-@router.post("/", response_model=ExportResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", responses={status.HTTP_201_CREATED: {"model": ExportResponse}}, status_code=status.HTTP_201_CREATED)
 async def register_export(
         export: ExportRequest,
         current_user: User = Depends(get_current_user),
@@ -156,8 +179,10 @@ async def register_export(
                 content={"error": "Failed to create export."}
             )
 
-        export_response = assemble_export_response_from_entity(created_export)
-        return export_response
+        return ORJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=assemble_export_dict_from_entity(created_export)
+        )
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -165,7 +190,7 @@ async def register_export(
         )
 
 
-@router.patch("/{export_id}/routes/{route_id}/assign", response_model=ExportResponse, status_code=status.HTTP_200_OK)
+@router.patch("/{export_id}/routes/{route_id}/assign", responses={status.HTTP_200_OK: {"model": ExportResponse}}, status_code=status.HTTP_200_OK)
 async def assign_route_id_to_export(
         export_id: Annotated[str, Path(
             title="The ID of the export to assign the new route",
@@ -215,8 +240,7 @@ async def assign_route_id_to_export(
                 content={"error": "Export for given id not found"}
             )
 
-        export_response = assemble_export_response_from_entity(export)
-        return export_response
+        return ORJSONResponse(content=assemble_export_dict_from_entity(export))
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,4 +1,6 @@
-﻿from pydantic import BaseModel, Field
+﻿from datetime import datetime
+
+from pydantic import BaseModel, Field
 
 
 class ExportResponse(BaseModel):
@@ -35,7 +37,7 @@ class ExportResponse(BaseModel):
     :ivar user_id: The identifier for the user who initiated the export.
     :type user_id: str
     :ivar created_at: The date and time when the export was created.
-    :type created_at: str
+    :type created_at: datetime
     """
     id: str = Field(title="The unique identifier of the export")
     comercial_description: str = Field(title="The commercial description of the product to be exported")
@@ -47,4 +49,4 @@ class ExportResponse(BaseModel):
     quantity: float = Field(title="The quantity of the exported goods, using the unit specified")
     optimized_route_id: str = Field(title="The identifier for the optimized route or transportation pathway used for the export")
     user_id: str = Field(title="The identifier for the user who initiated the export")
-    created_at: str = Field(title="The date and time when the export was created")
\ No newline at end of file
+    created_at: datetime = Field(title="The date and time when the export was created")
\ No newline at end of file
@@ -1,15 +1,22 @@
 ﻿"""
 Application service for user management.
 """
+import asyncio
 from typing import Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.iam.domain.models.user import User
 from app.iam.domain.services.support.user_service import UserService
 from app.iam.infrastructure.hashing.hashing_service import HashingService
+from app.iam.infrastructure.middleware.authorize_user import invalidate
 from app.iam.infrastructure.repositories.user_repository import UserRepository
 from app.iam.infrastructure.tokens.token_service import TokenService
 
+# Stateless services shared by every UserApplicationService instance
+_USER_SERVICE = UserService()
+_HASHING_SERVICE = HashingService()
+_TOKEN_SERVICE = TokenService()
+
 class UserApplicationService:
     """
     Application service for user-related use cases.
@@ -25,10 +32,10 @@ class UserApplicationService:
         :param db: The database session.
         """
         self.db = db
-        self.user_service = UserService()
+        self.user_service = _USER_SERVICE
         self.user_repository = UserRepository(db)
-        self.hashing_service = HashingService()
-        self.token_service = TokenService()
+        self.hashing_service = _HASHING_SERVICE
+        self.token_service = _TOKEN_SERVICE
 
     async def sign_up(
         self,
@@ -58,8 +65,8 @@ class UserApplicationService:
         if await self.user_repository.exists_by_email(email):
             raise ValueError("Email already registered")
 
-        # Hash password before persisting
-        hashed_password = self.hashing_service.hash(password)
+        # Hash password before persisting (in a worker thread, bcrypt would block the event loop)
+        hashed_password = await self.hashing_service.hash_async(password)
         
         # Create user with domain validation
         user = self.user_service.create_user(full_name, email, hashed_password)
@@ -69,6 +76,50 @@ class UserApplicationService:
         
         return created_user
 
+    async def sign_up_bulk(self, users_data: list[dict]) -> list[User]:
+        """
+        Register many users at once.
+
+        Every row is validated before anything is hashed or written, the passwords
+        are hashed concurrently in worker threads, and the users are persisted with
+        a single bulk insert.
+
+        :param users_data: List of dictionaries with the full_name, email and password of each user
+        :return: The created User entities
+        :raises ValueError: If a row fails validation or an email is repeated or already registered
+        """
+        emails = set()
+        for row_number, row in enumerate(users_data, start=1):
+            try:
+                for field in ("full_name", "email", "password"):
+                    if not isinstance(row[field], str):
+                        raise ValueError(f"{field} must be a string")
+                self.user_service.validate_full_name(row["full_name"])
+                self.user_service.validate_email(row["email"])
+                self.user_service.validate_password(row["password"])
+            except (KeyError, ValueError, TypeError) as e:
+                raise ValueError(f"Invalid data for row number {row_number}: {e}")
+
+            email = row["email"].strip().lower()
+            if email in emails:
+                raise ValueError(f"Email repeated for row number {row_number}")
+            emails.add(email)
+
+        registered_emails = await self.user_repository.get_registered_emails(emails)
+        if registered_emails:
+            raise ValueError(f"Emails already registered: {', '.join(sorted(registered_emails))}")
+
+        hashed_passwords = await asyncio.gather(
+            *(self.hashing_service.hash_async(row["password"]) for row in users_data)
+        )
+
+        users = [
+            self.user_service.create_user(row["full_name"], row["email"], hashed_password)
+            for row, hashed_password in zip(users_data, hashed_passwords)
+        ]
+
+        return await self.user_repository.bulk_create(users)
+
     async def sign_in(self, email: str, password: str) -> Tuple[User, str]:
         """
         Authenticate a user and generate an access token.
@@ -83,11 +134,12 @@ class UserApplicationService:
         """
         # Find user by email
         user = await self.user_repository.get_by_email(email)
-        if not user:
-            raise ValueError("Invalid credentials")
 
-        # Verify password
-        if not self.hashing_service.verify(password, user.hashed_password):
+        # Verify password (in a worker thread, bcrypt would block the event loop).
+        # Unknown emails are verified against a dummy hash, so they take as long as a wrong password.
+        hashed_password = user.hashed_password if user else await self.hashing_service.dummy_hash_async()
+        password_matches = await self.hashing_service.verify_async(password, hashed_password)
+        if not user or not password_matches:
             raise ValueError("Invalid credentials")
 
         # Generate access token
@@ -117,20 +169,30 @@ class UserApplicationService:
         """
         Change the password of a user.
 
+        Only the hashed password is read, and it is replaced with a single conditional
+        UPDATE instead of loading and merging the whole user.
+
         :param user_id: The id of the user.
         :param old_password: The old password.
         :param new_password: The new password.
         """
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
+        hashed_password = await self.user_repository.get_hashed_password(user_id)
+        if not hashed_password:
             raise ValueError("User not found")
 
-        if not self.hashing_service.verify(old_password, user.hashed_password):
+        if not await self.hashing_service.verify_async(old_password, hashed_password):
             raise ValueError("Incorrect current password")
         
         # Validate new password
         self.user_service.validate_password(new_password)
+        if await self.hashing_service.verify_async(new_password, hashed_password):
+            raise ValueError("New password cannot be the same as the old one")
+
+        new_hashed_password = await self.hashing_service.hash_async(new_password)
+        self.user_service.validate_new_hashed_password(new_hashed_password)
+
+        if await self.user_repository.update_password(user_id, hashed_password, new_hashed_password) == 0:
+            raise ValueError("The password was changed by another request")
 
-        new_hashed_password = self.hashing_service.hash(new_password)
-        self.user_service.change_password(user, new_hashed_password)
-        await self.user_repository.update(user)
\ No newline at end of file
+        # Drop the cached user so the next request loads the new password
+        invalidate(user_id)
\ No newline at end of file
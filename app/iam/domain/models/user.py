@@ -6,7 +6,7 @@ from datetime import datetime
 
 from app.shared.domain.models.base_entity import BaseEntity
 
-@dataclass
+@dataclass(slots=True)
 class User(BaseEntity):
     """
     Represents a user in the system.
@@ -1,9 +1,13 @@
 ﻿"""
 User Service class with methods for user management.
 """
+import hmac
 import re
 from app.iam.domain.models.user import User
 
+# Precompiled pattern used by the email validation
+_EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+
 class UserService:
     """
     Domain service for user-related business logic.
@@ -53,8 +57,7 @@ class UserService:
             raise ValueError("Email is required")
         
         # Basic email format validation (allows any format like example@example.com)
-        email_pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-        if not re.match(email_pattern, email):
+        if not _EMAIL_RE.match(email):
             raise ValueError("Invalid email format")
     
     @staticmethod
@@ -71,23 +74,36 @@ class UserService:
         if not password:
             raise ValueError("Password is required")
         
-        if len(password) < 8:
+        length = len(password)
+        if length < 8:
             raise ValueError("Password must be at least 8 characters long")
         
-        # Bcrypt has a 72-byte limit, so we enforce a 72-character limit
-        if len(password) > 72:
-            raise ValueError("Password must not exceed 72 characters")
+        # Passwords are pre-hashed before bcrypt, so any length is hashed in full;
+        # the upper bound only keeps oversized inputs from costing time to hash
+        if length > 1024:
+            raise ValueError("Password must not exceed 1024 characters")
+        
+        # Look for ASCII uppercase letters, lowercase letters and digits in a single pass
+        has_upper = has_lower = has_digit = False
+        for char in password:
+            code = ord(char)
+            if 65 <= code <= 90:
+                has_upper = True
+            elif 97 <= code <= 122:
+                has_lower = True
+            elif 48 <= code <= 57:
+                has_digit = True
         
         # Check for at least one uppercase letter
-        if not re.search(r'[A-Z]', password):
+        if not has_upper:
             raise ValueError("Password must contain at least one uppercase letter")
         
         # Check for at least one lowercase letter
-        if not re.search(r'[a-z]', password):
+        if not has_lower:
             raise ValueError("Password must contain at least one lowercase letter")
         
         # Check for at least one digit
-        if not re.search(r'\d', password):
+        if not has_digit:
             raise ValueError("Password must contain at least one number")
     
     @staticmethod
@@ -102,7 +118,8 @@ class UserService:
         Raises:
             ValueError: If passwords don't match
         """
-        if password != confirm_password:
+        # Constant-time comparison, so the time taken doesn't reveal the matching prefix
+        if not hmac.compare_digest(password.encode('utf-8'), confirm_password.encode('utf-8')):
             raise ValueError("Passwords do not match")
 
     @staticmethod
@@ -132,10 +149,20 @@ class UserService:
         :param user: The user whose password is to be changed.
         :param new_hashed_password: The new hashed password.
         """
-        if not new_hashed_password or not new_hashed_password.strip():
-            raise ValueError("Password cannot be empty")
+        UserService.validate_new_hashed_password(new_hashed_password)
+
+        user.update_password(new_hashed_password)
+
+    @staticmethod
+    def validate_new_hashed_password(new_hashed_password: str) -> None:
+        """
+        Validates that a new hashed password can replace the current one.
 
-        if new_hashed_password == user.hashed_password:
-            raise ValueError("New password cannot be the same as the old one")
+        Every hash has its own salt, so reusing the old password cannot be detected by
+        comparing hashes; it must be checked against the plain password before hashing.
 
-        user.update_password(new_hashed_password)
\ No newline at end of file
+        :param new_hashed_password: The new hashed password.
+        :raises ValueError: If the new hashed password is empty.
+        """
+        if not new_hashed_password or not new_hashed_password.strip():
+            raise ValueError("Password cannot be empty")
\ No newline at end of file
@@ -1,59 +1,188 @@
 ﻿"""
 Hashing Service for hashing passwords of the users.
 """
+import asyncio
+import base64
+import os
+import hashlib
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import bcrypt
 
+# Dedicated pool for bcrypt, so hashing doesn't compete with other work on the default executor
+_HASHING_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+@lru_cache(maxsize=4)
+def _dummy_hash(rounds: int) -> str:
+    """
+    Creates the hash of a random password with the given cost factor.
+
+    :param rounds: The bcrypt cost factor
+    :return: The dummy hashed password
+    """
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed = bcrypt.hashpw(base64.b64encode(hashlib.sha256(os.urandom(32)).digest()), salt)
+    return HashingService.PREHASH_PREFIX + hashed.decode('utf-8')
+
+@lru_cache(maxsize=1024)
+def _split_stored_hash(hashed_password: str) -> tuple[bool, bytes]:
+    """
+    Splits a stored hash into its scheme and the raw bcrypt hash bytes.
+
+    The same users' hashes are verified repeatedly, so the result is cached to skip
+    the prefix check, slicing and encoding on later verifications.
+
+    :param hashed_password: The stored hashed password
+    :return: Whether the password was pre-hashed with SHA-256, and the bcrypt hash as bytes
+    """
+    if hashed_password.startswith(HashingService.PREHASH_PREFIX):
+        return True, hashed_password[len(HashingService.PREHASH_PREFIX):].encode('utf-8')
+    return False, hashed_password.encode('utf-8')
+
 class HashingService:
     """
     Service for hashing and verifying passwords using bcrypt.
     
-    Bcrypt has a maximum password length of 72 bytes. Passwords longer
-    than this are automatically truncated to comply with this limit.
+    Bcrypt has a maximum password length of 72 bytes. To avoid truncating
+    long passwords, they are pre-hashed with SHA-256 and base64-encoded
+    (always 44 bytes) before bcrypt. Hashes created before the pre-hash
+    have no PREHASH_PREFIX and are still verified with the old truncation.
     """
     
     # Bcrypt has a maximum password length of 72 bytes
     MAX_PASSWORD_LENGTH = 72
+
+    # Prefix of the stored hashes whose password was pre-hashed with SHA-256
+    PREHASH_PREFIX = "sha256$"
+
+    # Bcrypt cost factor used for every new hash (configured at startup)
+    ROUNDS = 12
+
+    # Bounds of the cost factor accepted by the calibration
+    MIN_ROUNDS = 10
+    MAX_ROUNDS = 15
+
+    @staticmethod
+    def calibrate_rounds(target_ms: float) -> int:
+        """
+        Picks the highest bcrypt cost factor whose hash takes at most the target time.
+
+        One hash is timed with MIN_ROUNDS; each extra round doubles the hashing time,
+        so the cost factor is derived from that single measurement and clamped to
+        [MIN_ROUNDS, MAX_ROUNDS].
+
+        :param target_ms: The hashing time budget in milliseconds
+        :return: The calibrated cost factor
+        """
+        start = time.perf_counter()
+        bcrypt.hashpw(b"x" * HashingService.MAX_PASSWORD_LENGTH, bcrypt.gensalt(rounds=HashingService.MIN_ROUNDS))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        extra_rounds = math.floor(math.log2(target_ms / elapsed_ms)) if target_ms > elapsed_ms else 0
+        return min(HashingService.MIN_ROUNDS + extra_rounds, HashingService.MAX_ROUNDS)
     
+    @staticmethod
+    def dummy_hash() -> str:
+        """
+        Gets a hash that no password matches, created with the current cost factor.
+
+        Verifying against it takes as long as verifying a real user's password, so it
+        can be used when the user doesn't exist without revealing it through timing.
+        The hash is created once per cost factor and reused afterward.
+
+        :return: The dummy hashed password
+        """
+        return _dummy_hash(HashingService.ROUNDS)
+
+    @staticmethod
+    async def dummy_hash_async() -> str:
+        """
+        Gets the dummy hash, creating it in the dedicated hashing thread pool if needed.
+
+        Creating it is a full bcrypt hash, so it must not run on the event loop.
+
+        :return: The dummy hashed password
+        """
+        return await asyncio.get_running_loop().run_in_executor(_HASHING_POOL, HashingService.dummy_hash)
+
+    @staticmethod
+    def _prehash(password: str) -> bytes:
+        """
+        Pre-hashes a password with SHA-256 and encodes the digest in base64.
+
+        :param password: The password to be pre-hashed
+        :return: The 44-byte base64 SHA-256 digest of the password
+        """
+        return base64.b64encode(hashlib.sha256(password.encode('utf-8')).digest())
+
     @staticmethod
     def hash(password: str) -> str:
         """
         Hashes a password using bcrypt.
         
-        Bcrypt has a 72-byte limit. If the password is longer, it will be
-        automatically truncated to prevent errors.
+        The password is pre-hashed with SHA-256, so passwords of any length
+        are hashed in full and bcrypt always receives a 44-byte input.
 
         :param password: The password to be hashed
-        :return: The hashed password
+        :return: The hashed password, prefixed with PREHASH_PREFIX
         """
-        # Truncate password to 72 bytes if necessary (bcrypt limitation)
-        password_bytes = password.encode('utf-8')
-        if len(password_bytes) > HashingService.MAX_PASSWORD_LENGTH:
-            password_bytes = password_bytes[:HashingService.MAX_PASSWORD_LENGTH]
-        
-        # Generate salt and hash password
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
+        # Generate salt and hash the pre-hashed password
+        salt = bcrypt.gensalt(rounds=HashingService.ROUNDS)
+        hashed = bcrypt.hashpw(HashingService._prehash(password), salt)
         
         # Return as string
-        return hashed.decode('utf-8')
+        return HashingService.PREHASH_PREFIX + hashed.decode('utf-8')
 
     @staticmethod
     def verify(plain_password: str, hashed_password: str) -> bool:
         """
         Compares a plain password with a hashed password.
         
-        The plain password is truncated to 72 bytes before verification
-        to match the behavior during hashing.
+        Hashes with PREHASH_PREFIX are compared against the SHA-256 pre-hash of
+        the plain password. Older hashes are compared against the plain password
+        truncated to 72 bytes, to match the behavior when they were created.
 
         :param plain_password: A plain password to be compared
         :param hashed_password: The hashed password to be compared
         :return: True if the passwords match, False otherwise
         """
-        # Truncate password to 72 bytes if necessary (bcrypt limitation)
-        password_bytes = plain_password.encode('utf-8')
-        if len(password_bytes) > HashingService.MAX_PASSWORD_LENGTH:
-            password_bytes = password_bytes[:HashingService.MAX_PASSWORD_LENGTH]
+        is_prehashed, hashed_bytes = _split_stored_hash(hashed_password)
+        if is_prehashed:
+            password_bytes = HashingService._prehash(plain_password)
+        else:
+            # Truncate password to 72 bytes if necessary (bcrypt limitation)
+            password_bytes = plain_password.encode('utf-8')
+            if len(password_bytes) > HashingService.MAX_PASSWORD_LENGTH:
+                password_bytes = password_bytes[:HashingService.MAX_PASSWORD_LENGTH]
         
         # Compare passwords
-        hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
\ No newline at end of file
+        return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+    @staticmethod
+    async def hash_async(password: str) -> str:
+        """
+        Hashes a password using bcrypt in the dedicated hashing thread pool.
+
+        Bcrypt releases the GIL, so running it in a thread keeps the event loop free
+        to serve other requests while the hash is computed.
+
+        :param password: The password to be hashed
+        :return: The hashed password
+        """
+        return await asyncio.get_running_loop().run_in_executor(_HASHING_POOL, HashingService.hash, password)
+
+    @staticmethod
+    async def verify_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Compares a plain password with a hashed password in the dedicated hashing thread pool.
+
+        :param plain_password: A plain password to be compared
+        :param hashed_password: The hashed password to be compared
+        :return: True if the passwords match, False otherwise
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _HASHING_POOL, HashingService.verify, plain_password, hashed_password
+        )
@@ -1,3 +1,4 @@
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,13 +8,28 @@ from app.iam.infrastructure.repositories.user_repository import UserRepository
 from app.iam.infrastructure.tokens.token_service import TokenService
 from app.shared.infrastructure.persistence.session_generator import get_db
 
-# HTTPBearer security scheme for JWT tokens
-security = HTTPBearer()
+# HTTPBearer security scheme for JWT tokens (missing credentials are handled in get_current_user)
+security = HTTPBearer(auto_error=False)
 
 token_service = TokenService()
 
+# Recently authenticated users, keyed by their id
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+def invalidate(user_id: str) -> None:
+    """
+    Removes a user from the authenticated users cache.
+
+    Must be called whenever the stored user changes (e.g., after a password change),
+    so the next request loads it again from the database.
+
+    Args:
+        user_id: The id of the user to remove
+    """
+    _user_cache.pop(user_id, None)
+
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
@@ -29,23 +45,27 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    try:
-        payload = token_service.decode_token(token)
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, 
-                detail="Invalid token payload"
-            )
-    except HTTPException:
-        raise
-    except Exception:
+    # Reject requests without a bearer token before decoding anything
+    if credentials is None or not credentials.credentials:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+
+    # decode_token raises a 401 HTTPException for invalid or expired tokens
+    payload = token_service.decode_token(credentials.credentials)
+    user_id: str = payload.get("sub")
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, 
-            detail="Invalid or expired token"
+            detail="Invalid token payload"
         )
 
+    # Users are cached for 30 seconds, so a burst of requests only loads the user once
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
+
     user_repo = UserRepository(db)
     user = await user_repo.get_by_id(user_id)
     if not user:
@@ -54,4 +74,5 @@ async def get_current_user(
             detail="User not found"
         )
 
+    _user_cache[user_id] = user
     return user
\ No newline at end of file
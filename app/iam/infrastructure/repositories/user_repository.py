@@ -1,10 +1,16 @@
-﻿from sqlalchemy import select, exists
+﻿from dataclasses import asdict
+from datetime import datetime
+
+from sqlalchemy import bindparam, insert, select, update, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.iam.domain.models.user import User
 from app.iam.infrastructure.models.user_model import UserModel
 from app.shared.infrastructure.repositories.base_repository import BaseRepository
 
+# Statement reused by every email lookup, only the bound email changes between calls
+_GET_BY_EMAIL_STMT = select(UserModel).where(UserModel.email == bindparam("email"))
+
 class UserRepository(BaseRepository[User, UserModel]):
     def __init__(self, db: AsyncSession):
         """
@@ -53,9 +59,7 @@ class UserRepository(BaseRepository[User, UserModel]):
         :param email: The email of the user.
         :return: The user with the given email, if found, otherwise None.
         """
-        result = await self._db.execute(
-            select(self._model).where(self._model.email == email)
-        )
+        result = await self._db.execute(_GET_BY_EMAIL_STMT, {"email": email})
         model = result.scalar_one_or_none()
         return self.to_entity(model) if model else None
 
@@ -63,9 +67,77 @@ class UserRepository(BaseRepository[User, UserModel]):
         """
         Checks if a user with the given email exists in the database.
 
+        The email is normalized like the stored ones (trimmed and lowercased), so the
+        lookup is a `SELECT 1 ... LIMIT 1` on the unique email index.
+
         :param email: The email of the user.
         :return: True if the user exists with the given email, False otherwise.
         """
-        query = select(exists().where(self._model.email == email))
+        query = (
+            select(literal(1))
+            .where(self._model.email == email.strip().lower())
+            .limit(1)
+        )
         result = await self._db.execute(query)
-        return result.scalar()
\ No newline at end of file
+        return result.scalar() is not None
+
+    async def get_hashed_password(self, user_id: str) -> "str | None":
+        """
+        Fetches only the hashed password of a user.
+
+        :param user_id: The id of the user.
+        :return: The hashed password of the user, if found, otherwise None.
+        """
+        result = await self._db.execute(
+            select(self._model.hashed_password).where(self._model.id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_password(self, user_id: str, old_hashed_password: str, new_hashed_password: str) -> int:
+        """
+        Replaces the hashed password of a user with a single conditional UPDATE.
+
+        The row is only updated if its hashed password is still the old one, so a
+        concurrent password change is not overwritten.
+
+        :param user_id: The id of the user.
+        :param old_hashed_password: The hashed password the user currently has.
+        :param new_hashed_password: The new hashed password.
+        :return: The number of updated rows (0 if the user doesn't exist or the password changed).
+        """
+        result = await self._db.execute(
+            update(self._model)
+            .where(self._model.id == user_id, self._model.hashed_password == old_hashed_password)
+            .values(hashed_password=new_hashed_password, updated_at=datetime.now())
+        )
+        await self._db.commit()
+        return result.rowcount
+
+    async def get_registered_emails(self, emails: set[str]) -> set[str]:
+        """
+        Fetches which of the given emails already belong to a user, in a single query.
+
+        :param emails: The normalized (trimmed and lowercased) emails to look for.
+        :return: The subset of the emails that are already registered.
+        """
+        if not emails:
+            return set()
+
+        result = await self._db.execute(
+            select(self._model.email).where(self._model.email.in_(emails))
+        )
+        return set(result.scalars().all())
+
+    async def bulk_create(self, users: list[User]) -> list["User"]:
+        """
+        Persists many users with a single multi-row INSERT and one commit.
+
+        :param users: The user entities to persist, with their passwords already hashed.
+        :return: The persisted user entities.
+        """
+        if not users:
+            return []
+
+        await self._db.execute(insert(self._model), [asdict(user) for user in users])
+        await self._db.commit()
+        return users
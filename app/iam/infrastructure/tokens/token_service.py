@@ -1,36 +1,149 @@
 ﻿import jwt
-from datetime import datetime, timedelta, timezone
+import orjson
+import time
+from functools import lru_cache
 from typing import Any
 
-from dotenv import dotenv_values
+from cachetools import TTLCache
 from fastapi import HTTPException
-from jwt import ExpiredSignatureError, InvalidTokenError
+from jwt import DecodeError, ExpiredSignatureError, InvalidTokenError
 
-from app.config import settings
+from app.config import get_settings
+
+# Time window (in seconds) in which the token signed for a subject is reused
+TOKEN_REUSE_WINDOW_SECONDS = 60
+
+# Payloads of recently decoded tokens, keyed by the raw token
+_decoded_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Options passed to every jwt.decode call
+_DECODE_OPTIONS = {"require": ["exp"], "verify_signature": True}
+
+@lru_cache(maxsize=1)
+def _get_expire_seconds() -> int:
+    """
+    Gets the lifetime of the access tokens in seconds.
+
+    Returns:
+        JWT_ACCESS_TOKEN_EXPIRE_MINUTES converted to seconds
+    """
+    return get_settings().JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+class _ORJSONPyJWT(jwt.PyJWT):
+    """
+    PyJWT codec that encodes and decodes the token payloads with orjson instead of json.
+    """
+    def _encode_payload(self, payload: dict[str, Any], headers: dict[str, Any] | None = None,
+                        json_encoder: Any = None) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+_jwt = _ORJSONPyJWT()
+
+@lru_cache(maxsize=1)
+def _get_jwt_params() -> tuple[bytes, tuple[str, ...]]:
+    """
+    Gets the secret key (as bytes) and the algorithms used to sign and decode tokens.
+
+    The key is encoded once, so PyJWT's HMAC (backed by OpenSSL's SHA-256) gets the
+    raw bytes directly on every call.
+
+    Returns:
+        A tuple with the encoded secret key and the tuple of accepted algorithms
+    """
+    settings = get_settings()
+    return settings.JWT_SECRET_KEY.encode(), (settings.JWT_ALGORITHM,)
 
 class TokenService:
     @staticmethod
     def create_access_token(data: dict[str, Any]) -> str:
         """
         Create a JWT access token.
+
+        When the only claim is the subject, the token signed for that subject is
+        reused during the same TOKEN_REUSE_WINDOW_SECONDS window instead of being
+        signed again.
         
         Args:
             data: Data to encode in the token (usually {"sub": user_id})
             
+        Returns:
+            Encoded JWT token string
+        """
+        if data.keys() == {"sub"}:
+            window = int(time.time() // TOKEN_REUSE_WINDOW_SECONDS)
+            return TokenService._create_subject_token(data["sub"], window)
+        return TokenService._sign(data)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _create_subject_token(sub: str, window: int) -> str:
+        """
+        Create (and cache) the JWT access token of a subject for a reuse window.
+
+        Args:
+            sub: The subject of the token
+            window: The reuse window index, only used as part of the cache key
+
+        Returns:
+            Encoded JWT token string
+        """
+        return TokenService._sign({"sub": sub})
+
+    @staticmethod
+    def _sign(data: dict[str, Any]) -> str:
+        """
+        Sign a JWT access token that expires after JWT_ACCESS_TOKEN_EXPIRE_MINUTES.
+
+        Args:
+            data: Data to encode in the token
+
         Returns:
             Encoded JWT token string
         """
         to_encode = data.copy()
-        # Use UTC timezone to avoid timezone issues
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        # Unix timestamps are UTC, and PyJWT accepts them directly
+        to_encode["exp"] = int(time.time()) + _get_expire_seconds()
+        secret_key, algorithms = _get_jwt_params()
+        return _jwt.encode(to_encode, secret_key, algorithm=algorithms[0])
 
     @staticmethod
     def decode_token(token: str) -> dict[str, Any]:
+        """
+        Decode and verify a JWT access token.
+
+        Valid tokens are cached for up to 60 seconds (and never past their expiration),
+        so a token sent on consecutive requests is only verified once. Invalid tokens
+        (including tokens without an exp claim) are never cached.
+
+        Args:
+            token: Encoded JWT token string
+
+        Returns:
+            The decoded token payload
+
+        Raises:
+            HTTPException: If the token is expired or invalid
+        """
+        payload = _decoded_tokens.get(token)
+        if payload is not None and payload["exp"] > time.time():
+            return payload
+
+        secret_key, algorithms = _get_jwt_params()
         try:
-            return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+            payload = _jwt.decode(token, secret_key, algorithms=algorithms, options=_DECODE_OPTIONS)
         except ExpiredSignatureError:
-            raise HTTPException(status_code=401, detail="Token expired")
+            raise HTTPException(status_code=401, detail="Token expired") from None
         except InvalidTokenError:
-            raise HTTPException(status_code=401, detail="Invalid token")
\ No newline at end of file
+            raise HTTPException(status_code=401, detail="Invalid token") from None
+
+        _decoded_tokens[token] = payload
+        return payload
\ No newline at end of file
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.iam.application.user_application_service import UserApplicationService
@@ -38,7 +39,7 @@ auth_router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 async def sign_up(
     request: SignUpRequest,
     session: AsyncSession = Depends(get_db)
-) -> UserResponse:
+) -> Response:
     """
     Register a new user account.
     
@@ -51,7 +52,7 @@ async def sign_up(
         session: Database session (injected)
         
     Returns:
-        User data without access token
+        User data without access token, encoded once with orjson
         
     Raises:
         HTTPException: If validation fails or email already exists
@@ -65,10 +66,14 @@ async def sign_up(
             confirm_password=request.confirm_password
         )
         
-        return UserResponse(
-            id=user.id,
-            full_name=user.full_name,
-            email=user.email
+        return Response(
+            content=orjson.dumps({
+                "id": user.id,
+                "full_name": user.full_name,
+                "email": user.email
+            }),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json"
         )
     except ValueError as e:
         raise HTTPException(
@@ -113,7 +118,7 @@ async def sign_up(
 async def sign_in(
     request: SignInRequest,
     session: AsyncSession = Depends(get_db)
-) -> AuthenticatedUserResponse:
+) -> Response:
     """
     Authenticate a user and obtain an access token.
     
@@ -125,7 +130,7 @@ async def sign_in(
         session: Database session (injected)
         
     Returns:
-        User data with access token
+        User data with access token, encoded once with orjson
         
     Raises:
         HTTPException: If credentials are invalid
@@ -137,11 +142,14 @@ async def sign_in(
             password=request.password
         )
         
-        return AuthenticatedUserResponse(
-            id=user.id,
-            full_name=user.full_name,
-            email=user.email,
-            token=token
+        return Response(
+            content=orjson.dumps({
+                "id": user.id,
+                "full_name": user.full_name,
+                "email": user.email,
+                "token": token
+            }),
+            media_type="application/json"
         )
     except ValueError as e:
         raise HTTPException(
@@ -22,7 +22,7 @@ class SignInRequest(BaseModel):
     password: str = Field(
         ...,
         min_length=8,
-        max_length=72,
+        max_length=1024,
         description="The user's password",
         example="SecurePass123"
     )
@@ -32,15 +32,15 @@ class SignUpRequest(BaseModel):
     password: str = Field(
         ...,
         min_length=8,
-        max_length=72,
-        description="The user's password (min 8 chars, max 72 chars, must include uppercase, lowercase, and number)",
+        max_length=1024,
+        description="The user's password (min 8 chars, max 1024 chars, must include uppercase, lowercase, and number)",
         example="SecurePass123"
     )
     
     confirm_password: str = Field(
         ...,
         min_length=8,
-        max_length=72,
+        max_length=1024,
         description="Password confirmation (must match password)",
         example="SecurePass123"
     )
@@ -1,21 +1,49 @@
 ﻿"""
 Application service for ports.
 """
+from datetime import datetime
+
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.port_management.domain.models.port import Port
 from app.port_management.domain.services.support.port_service import PortService
 from app.port_management.infrastructure.repositories.port_repository import PortRepository
+from app.shared.infrastructure.caching.invalidation import notify_port_network_changed, on_port_network_change
 from app.shared.infrastructure.readers.csv_reader import read_csv_from_url
 
+# Stateless domain service shared by every PortApplicationService instance
+_PORT_SERVICE = PortService()
+
+# Encoded port listings and their entity tags, keyed by the normalized search term
+_ports_listing_cache: TTLCache = TTLCache(maxsize=64, ttl=60)
+
+# Bumped on every invalidation, so a listing loaded before a change is never cached after it
+_ports_listing_generation = 0
+
+@on_port_network_change
+def invalidate_ports_listing_cache() -> None:
+    """
+    Clears the cached port listings.
+
+    Runs after any change to ports or port connections, since the listings include
+    the number of connections of each port.
+    """
+    global _ports_listing_generation
+    _ports_listing_generation += 1
+    _ports_listing_cache.clear()
+
 class PortApplicationService:
+    # Created on every request; only the per-request repository is allocated
+    __slots__ = ("port_service", "port_repository")
+
     def __init__(self, db: AsyncSession):
         """
         Initialize the port application service with port service, port repository, and CSV file reader.
 
         :param db: The database session.
         """
-        self.port_service = PortService()
+        self.port_service = _PORT_SERVICE
         self.port_repository = PortRepository(db)
 
     async def seed_ports(self, file_url: str) -> None:
@@ -80,6 +108,8 @@ class PortApplicationService:
 
             row_id += 1
 
+        notify_port_network_changed()
+
     async def update_port(self, port_id: str, name: str, port_type: str, port_capacity: float) -> "Port | None":
         """
         Updates the port information.
@@ -101,11 +131,47 @@ class PortApplicationService:
 
             updated_port: Port = self.port_service.update_port_info(port_to_update, name, port_type, port_capacity)
             await self.port_repository.update(updated_port)
+            notify_port_network_changed()
             return updated_port
         except ValueError as e:
             raise ValueError(f"Error trying to update port: {e}")
 
 
+    @staticmethod
+    def get_cached_ports_listing(search_key: str) -> tuple[bytes, str] | None:
+        """
+        Retrieves a previously encoded port listing.
+
+        :param search_key: The normalized search term of the listing.
+        :return: The encoded listing and its entity tag if it is still cached, otherwise None.
+        """
+        return _ports_listing_cache.get(search_key)
+
+    @staticmethod
+    def get_ports_listing_generation() -> int:
+        """
+        Retrieves the current generation of the port listings, to be captured before loading one.
+
+        :return: The number of times the cached listings have been invalidated.
+        """
+        return _ports_listing_generation
+
+    @staticmethod
+    def cache_ports_listing(search_key: str, payload: bytes, etag: str, generation: int) -> None:
+        """
+        Caches an encoded port listing for a short time.
+
+        The listing is skipped if the listings were invalidated since it started loading,
+        as it may no longer match the database.
+
+        :param search_key: The normalized search term of the listing.
+        :param payload: The encoded listing.
+        :param etag: The entity tag of the encoded listing, computed once for every read.
+        :param generation: The listing generation captured before loading the listing.
+        """
+        if generation == _ports_listing_generation:
+            _ports_listing_cache[search_key] = (payload, etag)
+
     async def get_all_ports(self) -> list["Port"]:
         """
         Retrieves all ports from the database.
@@ -139,6 +205,21 @@ class PortApplicationService:
         except ValueError as e:
             raise ValueError(f"Error trying to retrieve port: {e}")
 
+    async def get_port_updated_at(self, port_id: str) -> datetime | None:
+        """
+        Retrieves the last update time of a port.
+
+        :param port_id: The id of the port.
+        :return: The last update time of the port if found, otherwise None.
+        """
+        try:
+            if port_id is None or port_id.strip() == "":
+                raise ValueError("To get a port, you must provide a valid port id.")
+
+            return await self.port_repository.get_updated_at(port_id)
+        except ValueError as e:
+            raise ValueError(f"Error trying to retrieve port: {e}")
+
     async def get_port_by_name(self, port_name: str) -> "Port | None":
         """
         Retrieves a port by its name
@@ -6,17 +6,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.port_management.domain.services.support.port_connection_service import PortConnectionService
 from app.port_management.infrastructure.repositories.port_connection_repository import PortConnectionRepository
 from app.port_management.infrastructure.repositories.port_repository import PortRepository
+from app.shared.infrastructure.caching.invalidation import notify_port_network_changed
 from app.shared.infrastructure.readers.csv_reader import read_csv_from_url
 from app.port_management.domain.models.port_connection import PortConnection
 
+# Stateless domain service shared by every PortConnectionApplicationService instance
+_PORT_CONNECTION_SERVICE = PortConnectionService()
+
 class PortConnectionApplicationService:
+    # Created on every request; only the per-request repositories are allocated
+    __slots__ = ("port_connection_service", "port_connection_repository", "port_repository")
+
     def __init__(self, db: AsyncSession):
         """
         Initialize the port connection application service with the port connection service and repository.
 
         :param db: The database session.
         """
-        self.port_connection_service = PortConnectionService()
+        self.port_connection_service = _PORT_CONNECTION_SERVICE
         self.port_connection_repository = PortConnectionRepository(db)
         self.port_repository = PortRepository(db)
 
@@ -100,6 +107,8 @@ class PortConnectionApplicationService:
 
             row_id += 1
 
+        notify_port_network_changed()
+
     async def get_all_connections(self) -> list["PortConnection"]:
         """
         Retrieve all port connections from the repository.
@@ -118,6 +127,8 @@ class PortConnectionApplicationService:
         """
         Retrieve a port connection by its ID.
 
+        The connections come from a cache shared across requests, so they must not be mutated.
+
         :param connection_id: The ID of the port connection.
         :return: The port connection if found, otherwise None.
 
@@ -133,6 +144,33 @@ class PortConnectionApplicationService:
         except Exception as e:
             raise Exception(f"Error retrieving connection: {e}")
 
+    async def count_connections_by_port_id(self, port_id: str) -> int:
+        """
+        Retrieve the number of port connections of a given port.
+
+        :param port_id: The id of the port.
+        :return: The number of port connections of the port.
+
+        :exception Exception: If there is an error while counting the connections.
+        """
+        try:
+            return await self.port_connection_repository.count_connections_by_port_id(port_id)
+        except Exception as e:
+            raise Exception(f"Error counting connections: {e}")
+
+    async def get_connection_counts_by_port(self) -> dict[str, int]:
+        """
+        Retrieve the number of port connections of every port.
+
+        :return: A dictionary mapping each port id to its number of port connections.
+
+        :exception Exception: If there is an error while counting the connections.
+        """
+        try:
+            return await self.port_connection_repository.get_connection_counts_by_port()
+        except Exception as e:
+            raise Exception(f"Error counting connections: {e}")
+
     async def delete_connection(self, connection_id: str) -> None:
         """
         Delete a port connection by its ID.
@@ -148,6 +186,7 @@ class PortConnectionApplicationService:
                 raise ValueError("To delete a connection, you must provide a valid connection ID.")
 
             deleted_connection = await self.port_connection_repository.delete(connection_id)
+            notify_port_network_changed()
             return deleted_connection
         except Exception as e:
             raise Exception(f"Error deleting connection: {e}")
@@ -181,6 +220,7 @@ class PortConnectionApplicationService:
                 cost_usd,
                 is_restricted
             )
+            notify_port_network_changed()
             return updated_connection
         except Exception as e:
             raise Exception(f"Error updating connection: {e}")
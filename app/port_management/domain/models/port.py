@@ -2,7 +2,7 @@
 
 from app.shared.domain.models.base_entity import BaseEntity
 
-@dataclass
+@dataclass(slots=True)
 class Port(BaseEntity):
     """
     Represents a port in the route planning context.
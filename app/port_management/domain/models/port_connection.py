@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from app.shared.domain.models.base_entity import BaseEntity
 
-@dataclass
+@dataclass(slots=True)
 class PortConnection(BaseEntity):
     """
     Represents a bidirectional connection between two ports in the graph.
@@ -2,6 +2,7 @@
 Service class for managing port connections in the route planning domain.
 """
 from app.port_management.domain.models.port_connection import PortConnection
+from app.shared.domain.validation import is_blank
 
 class PortConnectionService:
     def __init__(self):
@@ -39,31 +40,34 @@ class PortConnectionService:
         :raises ValueError: If the values entered are invalid
         """
         try:
-            distance_km = float(distance_km)
-            time_hours = float(time_hours)
-            cost_usd = float(cost_usd)
-            is_restricted = bool(is_restricted)
-
-            if time_hours <= 0:
-                raise ValueError("Time in hours must be greater than 0")
-            if cost_usd <= 0:
-                raise ValueError("Cost in USD must be greater than 0")
-            if distance_km <= 0:
-                raise ValueError("Distance in km must be greater than 0")
-            if port_a_id.strip() == "":
-                raise ValueError("Id of port A cannot be an empty string")
-            if port_a_name.strip() == "":
-                raise ValueError("Name of port A cannot be an empty string")
-            if port_b_id.strip() == "":
-                raise ValueError("Id of port B cannot be an empty string")
-            if port_b_name.strip() == "":
-                raise ValueError("Name of port B cannot be an empty string")
-            if port_b_id == port_a_id:
-                raise ValueError("The id of both ports have to be different")
-            if route_type.strip() == "":
-                raise ValueError("Route type cannot be empty")
+            if type(distance_km) is not float:
+                distance_km = float(distance_km)
+            if type(time_hours) is not float:
+                time_hours = float(time_hours)
+            if type(cost_usd) is not float:
+                cost_usd = float(cost_usd)
         except (ValueError, TypeError):
             raise ValueError("Invalid data format")
+        is_restricted = bool(is_restricted)
+
+        if time_hours <= 0:
+            raise ValueError("Time in hours must be greater than 0")
+        if cost_usd <= 0:
+            raise ValueError("Cost in USD must be greater than 0")
+        if distance_km <= 0:
+            raise ValueError("Distance in km must be greater than 0")
+        if is_blank(port_a_id):
+            raise ValueError("Id of port A cannot be an empty string")
+        if is_blank(port_a_name):
+            raise ValueError("Name of port A cannot be an empty string")
+        if is_blank(port_b_id):
+            raise ValueError("Id of port B cannot be an empty string")
+        if is_blank(port_b_name):
+            raise ValueError("Name of port B cannot be an empty string")
+        if port_b_id == port_a_id:
+            raise ValueError("The id of both ports have to be different")
+        if is_blank(route_type):
+            raise ValueError("Route type cannot be empty")
 
         return PortConnection(
             port_a_id = port_a_id,
@@ -2,6 +2,7 @@
 Service class for managing ports in the route planning domain.
 """
 from app.port_management.domain.models.port import Port
+from app.shared.domain.validation import is_blank
 
 
 class PortService:
@@ -29,26 +30,30 @@ class PortService:
         :raises ValueError: If the latitude or longitude are invalid or the name, country, or port type are empty.
         """
         try:
-            latitude = float(latitude)
-            longitude = float(longitude)
-            capacity = float(capacity)
-            if latitude < -90 or latitude > 90:
-                raise ValueError("Latitude must be between -90 and 90")
-            if longitude < -180 or longitude > 180:
-                raise ValueError("Longitude must be between -180 and 180")
-            if name.strip() == "":
-                raise ValueError("Name cannot be empty")
-            if country.strip() == "":
-                raise ValueError("Country cannot be empty")
-            if port_type.strip() == "":
-                raise ValueError("Port type cannot be empty")
-            if capacity <= 0:
-                raise ValueError("Capacity must be greater than 0")
-            if in_graph_type.strip() == "":
-                raise ValueError("In-graph type cannot be empty")
+            if type(latitude) is not float:
+                latitude = float(latitude)
+            if type(longitude) is not float:
+                longitude = float(longitude)
+            if type(capacity) is not float:
+                capacity = float(capacity)
         except (ValueError, TypeError):
             raise ValueError("Invalid data format.")
 
+        if not -90 <= latitude <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        if not -180 <= longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+        if capacity <= 0:
+            raise ValueError("Capacity must be greater than 0")
+        if is_blank(name):
+            raise ValueError("Name cannot be empty")
+        if is_blank(country):
+            raise ValueError("Country cannot be empty")
+        if is_blank(port_type):
+            raise ValueError("Port type cannot be empty")
+        if is_blank(in_graph_type):
+            raise ValueError("In-graph type cannot be empty")
+
         return Port(name=name, country=country, latitude=latitude, longitude=longitude, in_graph_type=in_graph_type, capacity=capacity, port_type=port_type)
 
     @staticmethod
@@ -65,18 +70,15 @@ class PortService:
 
         :raises ValueError: If the name or port type are empty.
         """
-        try:
-            if name != "":
-                if name.strip() == "":
-                    raise ValueError("Input name cannot be empty.")
-                port.name = name
-            if port_type != "":
-                if port_type.strip() == "":
-                    raise ValueError("Input port type cannot be empty.")
-                port.type = port_type
-            if capacity != 0:
-                port.capacity = capacity
-        except (ValueError, TypeError):
-            raise ValueError("Invalid data format.")
+        if name != "":
+            if name.isspace():
+                raise ValueError("Input name cannot be empty.")
+            port.name = name
+        if port_type != "":
+            if port_type.isspace():
+                raise ValueError("Input port type cannot be empty.")
+            port.port_type = port_type
+        if capacity != 0:
+            port.capacity = capacity
 
         return port
\ No newline at end of file
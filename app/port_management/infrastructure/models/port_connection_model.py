@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Boolean, ForeignKey
+from sqlalchemy import Column, String, Float, Boolean, ForeignKey, Index
 from sqlalchemy.orm import Mapped, relationship
 
 from app.shared.infrastructure.models.base_model import BaseModelORM
@@ -19,6 +19,9 @@ class PortConnectionModel(BaseModelORM):
         is_restricted (bool): Whether the port "a" to the port "b" is restricted
     """
     __tablename__ = "port_connections"
+    __table_args__ = (
+        Index("ix_port_connections_port_a_id_port_b_id", "port_a_id", "port_b_id"),
+    )
 
     port_a_id: Mapped[str] = Column(String(36), ForeignKey("ports.id"))
     port_a_name: Mapped[str] = Column(String(255), nullable=False)
@@ -1,11 +1,27 @@
-from sqlalchemy import Result, select
+
+from cachetools import TTLCache
+from sqlalchemy import Result, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.port_management.infrastructure.models.port_connection_model import PortConnectionModel
 from app.shared.infrastructure.repositories.base_repository import BaseRepository, TModel, TEntity
 from app.port_management.domain.models.port_connection import PortConnection
 
+# Connections leaving each port, keyed by the port id and shared across sessions
+_connections_by_port_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+def invalidate_connections_cache() -> None:
+    """
+    Clears the cached connections of every port.
+
+    Called after any write to the port connections table, since a single write can
+    change the connections of a port other than the one it was looked up by.
+    """
+    _connections_by_port_cache.clear()
+
 class PortConnectionRepository(BaseRepository[PortConnection, PortConnectionModel]):
+    __slots__ = ()
+
     def __init__(self, db: AsyncSession):
         """
         Initializes a new instance of PortConnectionRepository.
@@ -32,7 +48,9 @@ class PortConnectionRepository(BaseRepository[PortConnection, PortConnectionMode
             time_hours=entity.time_hours,
             cost_usd=entity.cost_usd,
             route_type=entity.route_type,
-            is_restricted=entity.is_restricted
+            is_restricted=entity.is_restricted,
+            updated_at=entity.updated_at,
+            created_at=entity.created_at
         )
 
     def to_entity(self, model: PortConnectionModel) -> "PortConnection":
@@ -53,63 +71,99 @@ class PortConnectionRepository(BaseRepository[PortConnection, PortConnectionMode
             time_hours=model.time_hours,
             cost_usd=model.cost_usd,
             route_type=model.route_type,
-            is_restricted=model.is_restricted
+            is_restricted=model.is_restricted,
+            updated_at=model.updated_at,
+            created_at=model.created_at
         )
 
+    async def create(self, entity: PortConnection) -> "PortConnection":
+        """
+        Create a port connection and clear the cached connections.
+
+        :param entity: The port connection entity to create.
+
+        :return: The created port connection entity.
+        """
+        created = await super().create(entity)
+        invalidate_connections_cache()
+        return created
+
+    async def update(self, entity: PortConnection) -> "PortConnection":
+        """
+        Update a port connection and clear the cached connections.
+
+        :param entity: The port connection entity to update.
+
+        :return: The updated port connection entity.
+        """
+        updated = await super().update(entity)
+        invalidate_connections_cache()
+        return updated
+
+    async def delete(self, identifier: str) -> None:
+        """
+        Delete a port connection and clear the cached connections.
+
+        :param identifier: The id of the port connection to delete.
+        """
+        await super().delete(identifier)
+        invalidate_connections_cache()
+
     async def get_connections_by_port_id(self, port_id: str) -> list["PortConnection"]:
         """
         Retrieve all port connections for a given port id.
 
+        Results are cached per port for up to a minute and cleared on every connection write.
+        The returned list is a fresh copy, but the entities in it are shared with every other
+        caller of the same port, so they must be treated as read-only. To change a connection,
+        load it with `get_by_id` and save it with `update`.
+
         :param port_id: The id of the port.
 
-        :return: A list of port connections associated with the given port id.
+        :return: A list of port connections associated with the given port id, not to be mutated.
         """
-        result: Result = await self._db.execute(
-            select(self._model).where(self._model.port_a_id == port_id)
-        )
-        model = result.scalars().all()
-        return [self.to_entity(m) for m in model]
+        cached = _connections_by_port_cache.get(port_id)
+        if cached is None:
+            result: Result = await self._db.execute(
+                select(self._model).where(self._model.port_a_id == port_id)
+            )
+            cached = tuple(self.to_entity(m) for m in result.scalars().all())
+            _connections_by_port_cache[port_id] = cached
+        return list(cached)
 
-    async def get_all_maritime_connections(self) -> list["PortConnection"]:
+    async def count_connections_by_port_id(self, port_id: str) -> int:
         """
-        Retrieve all maritime port connections.
+        Count the port connections of a given port id in the database, bypassing the per-port cache.
+
+        :param port_id: The id of the port.
 
-        :return: A list of maritime port connections.
+        :return: The number of port connections associated with the given port id.
         """
         result: Result = await self._db.execute(
-            select(self._model).where(self._model.route_type == "maritime")
+            select(func.count()).select_from(self._model).where(self._model.port_a_id == port_id)
         )
-        model = result.scalars().all()
-        return [self.to_entity(m) for m in model]
+        return result.scalar_one()
 
-    async def get_all_air_connections(self) -> list["PortConnection"]:
+    async def get_connection_counts_by_port(self) -> dict[str, int]:
         """
-        Retrieve all airport connections.
+        Count the port connections of every port with a single GROUP BY query.
 
-        :return: A list of airport connections.
+        Ports without connections are not included in the result.
+
+        :return: A dictionary mapping each port id to its number of port connections.
         """
         result: Result = await self._db.execute(
-            select(self._model).where(self._model.route_type == "air")
+            select(self._model.port_a_id, func.count()).group_by(self._model.port_a_id)
         )
-        model = result.scalars().all()
-        return [self.to_entity(m) for m in model]
+        return dict(result.tuples().all())
 
-    async def get_connection_by_origin_and_destination_name(self, origin_name: str, destination_name: str) -> "PortConnection | None":
+    async def get_all_transport_connections(self) -> list["PortConnection"]:
         """
-        Retrieve a port connection by its origin and destination port names.
-
-        :param origin_name: The name of the origin port.
-        :param destination_name: The name of the destination port.
+        Retrieve all maritime and air port connections in a single query.
 
-        :return: The port connection entity if found, otherwise None.
+        :return: A list of maritime and air port connections.
         """
         result: Result = await self._db.execute(
-            select(self._model).where(
-                (self._model.port_a_name == origin_name) &
-                (self._model.port_b_name == destination_name)
-            )
+            select(self._model).where(self._model.route_type.in_(("maritime", "air")))
         )
-        model = result.scalars().first()
-        if model:
-            return self.to_entity(model)
-        return None
\ No newline at end of file
+        return [self.to_entity(m) for m in result.scalars().all()]
@@ -1,4 +1,6 @@
-﻿from sqlalchemy import Result, select
+﻿from datetime import datetime
+
+from sqlalchemy import Result, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.port_management.domain.models.port import Port
@@ -6,6 +8,8 @@ from app.port_management.infrastructure.models.port_model import PortModel
 from app.shared.infrastructure.repositories.base_repository import BaseRepository
 
 class PortRepository(BaseRepository[Port, PortModel]):
+    __slots__ = ()
+
     def __init__(self, db: AsyncSession):
         """
         Initialize the port repository.
@@ -54,67 +58,73 @@ class PortRepository(BaseRepository[Port, PortModel]):
             created_at=model.created_at
         )
 
-    async def get_all_maritime_ports(self):
+    def _entity_columns(self) -> tuple:
         """
-        Retrieve all maritime ports.
+        Columns needed to build a port entity, labeled with the entity field names.
 
-        :return: A list of maritime port entities.
+        Selecting these instead of the mapped class returns plain rows, so list queries
+        skip ORM hydration (identity map, instance state) for read-only results.
+
+        :return: The columns to select.
         """
-        maritime_result: Result = await self._db.execute(
-            select(self._model).where(self._model.port_type == 'maritime')
-        )
-        both_result: Result = await self._db.execute(
-            select(self._model).where(self._model.port_type == 'both')
+        return (
+            self._model.id,
+            self._model.name,
+            self._model.country,
+            self._model.latitude,
+            self._model.longitude,
+            self._model.in_graph_type,
+            self._model.capacity,
+            self._model.port_type,
+            self._model.created_at,
+            self._model.updated_at
         )
 
-        both_models = both_result.scalars().all()
-        maritime_models = maritime_result.scalars().all()
-
-        result_models = [self.to_entity(model) for model in both_models] + [self.to_entity(model) for model in maritime_models]
-
-        return result_models
-
-    async def get_all_air_ports(self):
+    async def get_updated_at(self, port_id: str) -> datetime | None:
         """
-        Retrieve all airports.
+        Retrieve only the last update time of a port, without loading the whole row.
 
-        :return: A list of airport entities.
+        :param port_id: The id of the port.
+        :return: The last update time of the port if found, otherwise None.
         """
-        air_result: Result = await self._db.execute(
-            select(self._model).where(self._model.port_type == 'air')
-        )
-        both_result: Result = await self._db.execute(
-            select(self._model).where(self._model.port_type == 'both')
+        result: Result = await self._db.execute(
+            select(self._model.updated_at).where(self._model.id == port_id)
         )
+        return result.scalar_one_or_none()
 
-        both_models = both_result.scalars().all()
-        air_models = air_result.scalars().all()
+    async def get_all_transport_ports(self):
+        """
+        Retrieve every maritime and air port (including the ones that are both) in a single query.
 
-        result_models = [self.to_entity(model) for model in both_models] + [self.to_entity(model) for model in air_models]
+        Each port appears once, unlike concatenating the maritime and air lists, where ports
+        of both types are listed twice.
 
-        return result_models
+        :return: A list of port entities.
+        """
+        result: Result = await self._db.execute(
+            select(*self._entity_columns())
+            .where(self._model.port_type.in_(('maritime', 'air', 'both')))
+        )
+        return [Port(**row._mapping) for row in result.all()]
 
     async def get_port_by_name(self, name: str):
         """
-        Retrieve a port by its name. First tries exact match, then partial match.
+        Retrieve a port by its name. An exact match is preferred over a partial match.
 
         :param name: The name of the port to retrieve.
         :return: The port entity if found, otherwise None.
         """
 
-        # Try exact match first
+        # Exact and prefix matches (e.g., "Buenos Aires" matches "Buenos Aires (EZE Argentina)")
+        # are fetched in a single round trip, ranking the exact match first
         result: Result = await self._db.execute(
-            select(self._model).where(self._model.name == name)
+            select(self._model)
+            .where(or_(self._model.name == name, self._model.name.like(f"{name}%")))
+            .order_by((self._model.name == name).desc())
+            .limit(1)
         )
         model = result.scalars().first()
-        
-        # If no exact match, try partial match (e.g., "Buenos Aires" matches "Buenos Aires (EZE Argentina)")
-        if not model:
-            result: Result = await self._db.execute(
-                select(self._model).where(self._model.name.like(f"{name}%"))
-            )
-            model = result.scalars().first()
-        
+
         if model:
             return self.to_entity(model)
         return None
\ No newline at end of file
@@ -26,4 +26,29 @@ def assemble_connection_response_from_entity(connection_entity: PortConnection)
         cost_usd=connection_entity.cost_usd,
         route_type=connection_entity.route_type,
         is_restricted=connection_entity.is_restricted
-    )
\ No newline at end of file
+    )
+
+
+
+def assemble_connection_dict_from_entity(connection_entity: PortConnection) -> dict:
+    """
+    Transforms a PortConnection entity into a plain dictionary with the PortConnectionResponse fields.
+
+    This skips the construction and validation of a PortConnectionResponse object, so it is
+    meant for endpoints that serialize the result directly with orjson.
+
+    :param connection_entity: The PortConnection entity to transform.
+    :type connection_entity: PortConnection
+    :return: A dictionary with the same keys and values as a PortConnectionResponse.
+    :rtype: dict
+    """
+    return {
+        "id": connection_entity.id,
+        "port_a_id": connection_entity.port_a_id,
+        "port_b_id": connection_entity.port_b_id,
+        "distance_km": connection_entity.distance_km,
+        "estimated_travel_time_hours": connection_entity.time_hours,
+        "cost_usd": connection_entity.cost_usd,
+        "route_type": connection_entity.route_type,
+        "is_restricted": connection_entity.is_restricted
+    }
\ No newline at end of file
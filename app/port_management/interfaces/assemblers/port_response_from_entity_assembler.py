@@ -1,4 +1,6 @@
-﻿from app.port_management.domain.models.port import Port
+﻿from functools import lru_cache
+
+from app.port_management.domain.models.port import Port
 from app.port_management.interfaces.schemas.responses.coordinates_response import Coordinates
 from app.port_management.interfaces.schemas.responses.port_response import PortResponse
 
@@ -9,7 +11,11 @@ def assemble_port_response_from_entity(port_entity: Port, connections: int) -> P
 
     This function takes an instance of the `Port` entity class and transforms
     it into an instance of the `PortResponse` class by mapping relevant attributes
-    from the source entity to the destination response object.
+    from the source entity to the destination response object. The data comes
+    from the domain layer, which already validated it, so the models are built
+    with `model_construct` to skip Pydantic validation. Responses are cached by
+    the port values and connection count, so an unchanged port is reused across
+    requests instead of being rebuilt.
 
     :param connections: The number of connections associated with the port.
     :param port_entity: The `Port` entity that contains data to construct a
@@ -19,16 +25,49 @@ def assemble_port_response_from_entity(port_entity: Port, connections: int) -> P
         `Port` entity.
     :rtype: PortResponse
     """
-    return PortResponse(
-        id=port_entity.id,
-        name=port_entity.name,
-        country=port_entity.country,
-        in_graph_type=port_entity.in_graph_type,
-        port_type=port_entity.port_type,
-        capacity=port_entity.capacity,
+    return _assemble_port_response(
+        port_entity.id,
+        port_entity.updated_at,
+        port_entity.name,
+        port_entity.country,
+        port_entity.in_graph_type,
+        port_entity.port_type,
+        port_entity.capacity,
+        port_entity.latitude,
+        port_entity.longitude,
+        connections
+    )
+
+
+@lru_cache(maxsize=8192)
+def _assemble_port_response(port_id: str, updated_at, name: str, country: str, in_graph_type: str,
+                            port_type: str, capacity: float, latitude: float, longitude: float,
+                            connections: int) -> PortResponse:
+    """
+    Builds the `PortResponse` for the given port values.
+
+    `updated_at` is only part of the cache key, so a port updated in place is not
+    served from a stale entry.
+    """
+    return PortResponse.model_construct(
+        id=port_id,
+        name=name,
+        country=country,
+        in_graph_type=in_graph_type,
+        port_type=port_type,
+        capacity=capacity,
         connections=connections,
-        coordinates=Coordinates(
-            latitude=port_entity.latitude,
-            longitude=port_entity.longitude
-        )
-    )
\ No newline at end of file
+        coordinates=_coordinates(latitude, longitude)
+    )
+
+
+@lru_cache(maxsize=8192)
+def _coordinates(latitude: float, longitude: float) -> Coordinates:
+    """
+    Returns the shared `Coordinates` for a latitude and longitude pair.
+
+    Keyed by the values rather than the port id, so a moved port gets new coordinates
+    without any invalidation, while responses rebuilt for the same port (e.g., when its
+    connection count changes) reuse the existing object.
+    """
+    return Coordinates.model_construct(latitude=latitude, longitude=longitude)
\ No newline at end of file
@@ -2,12 +2,12 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, status, Path, Response
 from fastapi.openapi.models import Example
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.port_management.application.port_connection_application_service import PortConnectionApplicationService
-from app.port_management.domain.models.port_connection import PortConnection
 from app.port_management.interfaces.assemblers.connection_response_from_entity_assembler import \
-    assemble_connection_response_from_entity
+    assemble_connection_response_from_entity, assemble_connection_dict_from_entity
 from app.port_management.interfaces.schemas.responses.port_connection_response import PortConnectionResponse
 from app.shared.infrastructure.persistence.session_generator import get_db
 
@@ -72,7 +72,7 @@ async def get_connection_by_id(
         return {"error": str(e)}
 
 
-@router.get("/", response_model=list[PortConnection], status_code=status.HTTP_200_OK)
+@router.get("/", responses={status.HTTP_200_OK: {"model": list[PortConnectionResponse]}}, status_code=status.HTTP_200_OK)
 async def get_all_connections(
         response: Response,
         port_app_service: PortConnectionApplicationService = Depends(get_connection_app_service)
@@ -80,6 +80,9 @@ async def get_all_connections(
     """
     Endpoint to retrieve all port connections.
 
+    The list is serialized directly with orjson instead of building and validating a
+    PortConnectionResponse per connection.
+
     :param response: To set the status code.
     :param port_app_service: Injected port connection application service.
 
@@ -91,10 +94,7 @@ async def get_all_connections(
             response.status_code = status.HTTP_404_NOT_FOUND
             return {"error": "Connections not found"}
 
-        responses = []
-        for connection in connections:
-            responses.append(assemble_connection_response_from_entity(connection))
-        return connections
+        return ORJSONResponse(content=[assemble_connection_dict_from_entity(connection) for connection in connections])
     except Exception as e:
         response.status_code = status.HTTP_400_BAD_REQUEST
         return {"error": str(e)}
\ No newline at end of file
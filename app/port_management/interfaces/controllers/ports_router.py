@@ -1,7 +1,11 @@
-﻿from typing import Annotated, Any
+﻿from datetime import datetime
+from typing import Annotated, Any, AsyncIterator
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, Path, Response, HTTPException
+from fastapi import APIRouter, Depends, status, Path, Request, Response, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.openapi.models import Example
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.port_management.application.port_application_service import PortApplicationService
@@ -14,11 +18,76 @@ from app.port_management.interfaces.assemblers.port_response_from_entity_assembl
 from app.port_management.interfaces.controllers.port_connections_router import get_connection_app_service
 from app.port_management.interfaces.schemas.responses.port_connection_response import PortConnectionResponse
 from app.port_management.interfaces.schemas.responses.port_response import PortResponse
+from app.shared.infrastructure.middleware.etag_middleware import compute_etag, etag_matches
 from app.shared.infrastructure.persistence.session_generator import get_db
 
 # Create a router for the ports
 router = APIRouter(prefix="/api/v1/ports", tags=["Ports"])
 
+# Encodes a whole port listing to JSON in a single pydantic-core call
+_PORTS_ADAPTER = TypeAdapter(list[PortResponse])
+
+# Number of ports encoded per chunk when streaming a listing
+_STREAM_BATCH_SIZE = 500
+
+# OpenAPI examples for the port id path parameter
+_PORT_ID_EXAMPLES = {
+    "invalid": Example(
+        summary="Invalid",
+        description="When using a non-uuid value for the id, an error is returned.",
+        value={
+            "id": "hi"
+        }
+    ),
+    "valid": Example(
+        summary="Normal",
+        description="A valid port id with a uuid type.",
+        value={
+            "id": "123e4567-e89b-12d3-a456-426614174000"
+        }
+    )
+}
+
+# Path parameter for the id of a port
+PORT_ID_PATH = Path(title="The ID of the port to get", openapi_examples=_PORT_ID_EXAMPLES)
+
+
+async def _stream_ports_listing(ports_response: list[PortResponse], cache_key: str | None,
+                                generation: int) -> AsyncIterator[bytes]:
+    """
+    Encodes a port listing as a JSON array in batches, so the first ports are sent before
+    the whole listing is encoded.
+
+    :param ports_response: The ports to encode.
+    :param cache_key: The search key to cache the complete listing under, or None to skip caching.
+    :param generation: The listing generation captured before the ports were loaded.
+    :return: An async iterator over the encoded chunks.
+    """
+    chunks = []
+    for start in range(0, len(ports_response), _STREAM_BATCH_SIZE):
+        batch = _PORTS_ADAPTER.dump_json(ports_response[start:start + _STREAM_BATCH_SIZE])
+        chunk = (b"[" if start == 0 else b",") + batch[1:-1]
+        chunks.append(chunk)
+        yield chunk
+    chunks.append(b"]")
+    yield b"]"
+
+    if cache_key is not None:
+        payload = b"".join(chunks)
+        PortApplicationService.cache_ports_listing(cache_key, payload, compute_etag(payload), generation)
+
+
+def _port_etag(port_id: str, updated_at: datetime, connections: int) -> str:
+    """
+    Builds the weak entity tag of a port response.
+
+    :param port_id: The id of the port.
+    :param updated_at: The last update time of the port.
+    :param connections: The number of connections of the port.
+    :return: The entity tag.
+    """
+    return f'W/"{port_id}-{updated_at.timestamp()}-{connections}"'
+
 
 # Get port application service
 def get_port_app_service(db: AsyncSession = Depends(get_db)) -> "PortApplicationService":
@@ -27,25 +96,8 @@ def get_port_app_service(db: AsyncSession = Depends(get_db)) -> "PortApplication
 
 @router.get("/{port_id}", response_model=PortResponse, status_code=status.HTTP_200_OK)
 async def get_port_by_id(
-        port_id: Annotated[str, Path(
-            title="The ID of the port to get",
-            openapi_examples={
-                "invalid": Example(
-                    summary="Invalid",
-                    description="When using a non-uuid value for the id, an error is returned.",
-                    value={
-                        "id": "hi"
-                    }
-                ),
-                "valid": Example(
-                    summary="Normal",
-                    description="A valid port id with a uuid type.",
-                    value={
-                        "id": "123e4567-e89b-12d3-a456-426614174000"
-                    }
-                )
-            }
-        )],
+        port_id: Annotated[UUID, PORT_ID_PATH],
+        request: Request,
         response: Response,
         port_app_service: PortApplicationService = Depends(get_port_app_service),
         connections_app_service: PortConnectionApplicationService = Depends(get_connection_app_service)
@@ -53,25 +105,39 @@ async def get_port_by_id(
     """
     Endpoint to retrieve a port by its id.
 
+    The response is tagged with an ETag built from the port's last update time and its number
+    of connections, both read from the database so every worker derives the same tag. When
+    the client sends `If-None-Match`, only those two values are read first, and a 304 is
+    returned without loading or serializing the port if the tag matches.
+
     :param connections_app_service: Injected port connection application service.
+    :param request: To read the conditional request headers.
     :param response: To set the status code.
     :param port_id: The id of the port.
     :param port_app_service: Injected port application service.
     :return: The port with the given id if found, otherwise None.
     """
+    port_key = str(port_id)
     try:
-        port: Port = await port_app_service.get_port_by_id(port_id)
+        connections_number = await connections_app_service.count_connections_by_port_id(port_key)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            updated_at = await port_app_service.get_port_updated_at(port_key)
+            if updated_at is not None:
+                etag = _port_etag(port_key, updated_at, connections_number)
+                if etag_matches(if_none_match, etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        port: Port = await port_app_service.get_port_by_id(port_key)
         if not port:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Port for given id not found"
             )
 
-        connections = await connections_app_service.get_connections_by_port_id(port_id)
-        connections_number = len(connections)
-
-        response = assemble_port_response_from_entity(port, connections_number)
-        return response
+        response.headers["ETag"] = _port_etag(port_key, port.updated_at, connections_number)
+        return assemble_port_response_from_entity(port, connections_number)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -81,6 +147,7 @@ async def get_port_by_id(
 
 @router.get("", response_model=list[PortResponse], status_code=status.HTTP_200_OK)
 async def get_all_ports(
+        request: Request,
         search: str | None = None,
         port_app_service: PortApplicationService = Depends(get_port_app_service),
         connections_app_service: PortConnectionApplicationService = Depends(get_connection_app_service)
@@ -88,17 +155,32 @@ async def get_all_ports(
     """
     Retrieve all ports, optionally filtered by search term.
 
+    The encoded listing of each search term is cached for a minute, and cleared whenever
+    ports or connections change, so repeated reads skip the database and serialization.
+    On a cache miss the listing is streamed in batches as it is encoded. Cached listings are
+    served with the entity tag computed when they were cached, and answered with a 304 when
+    the client's copy is current.
+
+    :param request: To read the conditional request headers.
     :param search: Optional search term to filter ports by name or country
     :param connections_app_service: Injected port connection application service.
     :param port_app_service: The port application service.
     :return: A list of ports if found, otherwise an empty list.
     """
     try:
+        search_lower = search.strip().lower() if search else ""
+        cached = port_app_service.get_cached_ports_listing(search_lower)
+        if cached is not None:
+            content, etag = cached
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+        generation = port_app_service.get_ports_listing_generation()
         ports: list[Port] = await port_app_service.get_all_ports()
         
         # Filter by search term if provided
-        if search and search.strip():
-            search_lower = search.strip().lower()
+        if search_lower:
             ports = [
                 port for port in ports
                 if (search_lower in port.name.lower() if port.name else False) or
@@ -109,18 +191,23 @@ async def get_all_ports(
             # Return empty list instead of 404 when no ports match
             return []
         
+        try:
+            connection_counts = await connections_app_service.get_connection_counts_by_port()
+            counts_loaded = True
+        except Exception:
+            # If connections fail, report 0 connections for every port
+            connection_counts = {}
+            counts_loaded = False
+
         ports_response = []
         for port in ports:
-            try:
-                connections = await connections_app_service.get_connections_by_port_id(port.id)
-                connections_number = len(connections)
-            except Exception:
-                # If connections fail, set to 0 and continue
-                connections_number = 0
-            
-            ports_response.append(assemble_port_response_from_entity(port, connections_number))
-
-        return ports_response
+            ports_response.append(assemble_port_response_from_entity(port, connection_counts.get(port.id, 0)))
+
+        # A listing with missing connection counts is served once but not cached
+        return StreamingResponse(
+            _stream_ports_listing(ports_response, search_lower if counts_loaded else None, generation),
+            media_type="application/json"
+        )
     except Exception as e:
         # Log the error but return a proper error response
         print(f"Error in get_all_ports: {str(e)}")
@@ -131,7 +218,7 @@ async def get_all_ports(
 
 @router.get("/{port_id}/connections", response_model=list[PortConnectionResponse], status_code=status.HTTP_200_OK)
 async def get_connections_by_port_id(
-        port_id: str,
+        port_id: UUID,
         response: Response,
         connection_app_service: PortConnectionApplicationService = Depends(get_connection_app_service),
 ) -> Any:
@@ -145,7 +232,7 @@ async def get_connections_by_port_id(
     :return: A list of port connections for the given port id if found, otherwise None.
     """
     try:
-        connections = await connection_app_service.get_connections_by_port_id(port_id)
+        connections = await connection_app_service.get_connections_by_port_id(str(port_id))
         if len(connections) == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
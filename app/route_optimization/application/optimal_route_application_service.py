@@ -1,9 +1,13 @@
 ﻿"""
 Application service for optimal routes.
 """
+import time
 
+from cachetools import LRUCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.port_management.domain.models.port import Port
+from app.port_management.domain.models.port_connection import PortConnection
 from app.port_management.infrastructure.repositories.port_connection_repository import PortConnectionRepository
 from app.port_management.infrastructure.repositories.port_repository import PortRepository
 from app.route_optimization.domain.models.optimal_route import OptimalRoute
@@ -13,6 +17,77 @@ from app.route_optimization.domain.services.orchestration.bellman_ford_algorithm
 from app.route_optimization.domain.services.orchestration.dijkstra_algorithm_service import DijkstraAlgorithmService
 from app.route_optimization.domain.services.support.optimal_route_service import OptimalRouteService
 from app.route_optimization.infrastructure.repositories.optimal_route_repository import OptimalRouteRepository
+from app.shared.infrastructure.caching.invalidation import on_port_network_change
+
+
+# Seconds a loaded network is reused at most, bounding staleness from writes in other processes
+_NETWORK_MAX_AGE = 60
+
+
+class _NetworkCache:
+    """
+    Holds the ports, connections and built algorithm graphs of one version of the port network,
+    so route requests reuse them until a port or connection changes.
+
+    Writes in this process invalidate it explicitly, and the maximum age bounds how long writes
+    from other processes go unseen, like the other per-process caches of the port network.
+    """
+    def __init__(self):
+        self.valid: bool = False
+        self.loaded_at: float = 0.0
+        # Bumped on every invalidation, so a reload that raced with a write is not kept
+        self.generation: int = 0
+        self.ports: list[Port] = []
+        self.connections: list[PortConnection] = []
+        # Port id -> port, and port name -> port
+        self.ports_by_id: dict[str, Port] = {}
+        self.ports_by_name: dict[str, Port] = {}
+        # (origin name, destination name) -> connection
+        self.edges: dict[tuple[str, str], PortConnection] = {}
+        # Algorithm key -> algorithm service with its graph already built
+        self.services: LRUCache = LRUCache(maxsize=16)
+
+    def is_current(self) -> bool:
+        """
+        Checks whether the cached network can still be used.
+
+        :return: True if the cached network is valid and not expired, otherwise False.
+        """
+        return self.valid and time.monotonic() - self.loaded_at < _NETWORK_MAX_AGE
+
+    def invalidate(self) -> None:
+        """
+        Forces the network to be reloaded by the next route request.
+        """
+        self.valid = False
+        self.generation += 1
+
+    def reset(self, valid: bool, ports: list[Port], connections: list[PortConnection]) -> None:
+        """
+        Replaces the cached network and drops every graph built for the previous one.
+
+        :param valid: Whether the network can be reused, or must be reloaded again on the next request.
+        :param ports: The ports of the network.
+        :param connections: The connections of the network.
+        """
+        self.valid = valid
+        self.loaded_at = time.monotonic()
+        self.ports = ports
+        self.connections = connections
+        self.ports_by_id = {port.id: port for port in ports}
+        self.ports_by_name = {port.name: port for port in ports}
+        self.edges = {}
+        for connection in connections:
+            # Keep the first connection of each pair, as the lookup by names did
+            self.edges.setdefault((connection.port_a_name, connection.port_b_name), connection)
+        self.services.clear()
+
+
+# Port network shared by every OptimalRouteApplicationService instance
+_NETWORK_CACHE = _NetworkCache()
+
+# Route requests must not run on a stale graph after a port or connection changes
+on_port_network_change(_NETWORK_CACHE.invalidate)
 
 
 class OptimalRouteApplicationService:
@@ -52,15 +127,20 @@ class OptimalRouteApplicationService:
         # (1) Retrieve ports and connections
         # ---------------------------------------------------------
         try:
-            # Always use multimodal to support intermodal connections
-            # This allows routes between maritime and air ports
-            maritime_ports = await self.ports_repository.get_all_maritime_ports()
-            air_ports = await self.ports_repository.get_all_air_ports()
-            ports = maritime_ports + air_ports
-            
-            maritime_connections = await self.connections_repository.get_all_maritime_connections()
-            air_connections = await self.connections_repository.get_all_air_connections()
-            connections = maritime_connections + air_connections
+            # The network is only reloaded when it was invalidated or expired
+            generation = _NETWORK_CACHE.generation
+            if not _NETWORK_CACHE.is_current():
+                # Always use multimodal to support intermodal connections
+                # This allows routes between maritime and air ports
+                ports = await self.ports_repository.get_all_transport_ports()
+                connections = await self.connections_repository.get_all_transport_connections()
+                # A network invalidated while loading is used once, then reloaded
+                _NETWORK_CACHE.reset(_NETWORK_CACHE.generation == generation, ports, connections)
+            ports = _NETWORK_CACHE.ports
+            connections = _NETWORK_CACHE.connections
+            edges = _NETWORK_CACHE.edges
+            ports_by_id = _NETWORK_CACHE.ports_by_id
+            ports_by_name = _NETWORK_CACHE.ports_by_name
             
             # Keep mode for record-keeping purposes
             actual_mode = mode if mode in ["maritime", "air", "multimodal"] else "multimodal"
@@ -73,8 +153,9 @@ class OptimalRouteApplicationService:
         algo = algorithm_name.lower()
         try:
             if algo == "astar" or algo == "a*":
-                service = AStarAlgorithmService()
                 algorithm_used = "AStar"
+                service_key = (algorithm_used,)
+                service = _NETWORK_CACHE.services.get(service_key) or AStarAlgorithmService()
 
             elif algo == "bellman-ford" or algo == "bellmanford":
                 # Validate BF parameters - use 'if is None' to allow 0 values
@@ -82,34 +163,38 @@ class OptimalRouteApplicationService:
                 distance_m = distance_m if distance_m is not None else 1.0
                 time_m = time_m if time_m is not None else 1.0
 
-                service = BellmanFordAlgorithmService(cost_m, distance_m, time_m)
                 algorithm_used = "Bellman-Ford"
+                service_key = (algorithm_used, cost_m, distance_m, time_m)
+                service = _NETWORK_CACHE.services.get(service_key) or BellmanFordAlgorithmService(cost_m, distance_m, time_m)
 
             elif algo == "dijkstra":
-                service = DijkstraAlgorithmService()
                 algorithm_used = "Dijkstra"
+                service_key = (algorithm_used,)
+                service = _NETWORK_CACHE.services.get(service_key) or DijkstraAlgorithmService()
 
             else:
                 raise ValueError(f"Unsupported algorithm '{algorithm_name}'.")
         except Exception as e:
             raise Exception(f"Error initializing algorithm: {e}")
 
-        # Build the graph
-        service.build_graph(ports, connections)
+        # Build the graph, unless this service was already built for the current network
+        if service_key not in _NETWORK_CACHE.services:
+            service.build_graph(ports, connections)
+            _NETWORK_CACHE.services[service_key] = service
 
         # ---------------------------------------------------------
         # (3) Get port entities to retrieve their names for the algorithm
         #     Accept both IDs and names - try ID first, then name
         # ---------------------------------------------------------
-        # Try as ID first
-        start_port = await self.ports_repository.get_by_id(start_port_name)
+        # Try as ID first, then as an exact name, both from the already loaded ports
+        start_port = ports_by_id.get(start_port_name) or ports_by_name.get(start_port_name)
         if not start_port:
-            # Try as name if ID lookup failed
+            # Fall back to the partial name match of the repository
             start_port = await self.ports_repository.get_port_by_name(start_port_name)
         
-        end_port = await self.ports_repository.get_by_id(end_port_name)
+        end_port = ports_by_id.get(end_port_name) or ports_by_name.get(end_port_name)
         if not end_port:
-            # Try as name if ID lookup failed
+            # Fall back to the partial name match of the repository
             end_port = await self.ports_repository.get_port_by_name(end_port_name)
         
         if not start_port:
@@ -139,14 +224,13 @@ class OptimalRouteApplicationService:
         # ---------------------------------------------------------
         # (5) Build connection list (route edges)
         # ---------------------------------------------------------
+        # The graph was built from the cached connections, so every edge is looked up in memory
         connections_list = []
         for i in range(len(optimal_route) - 1):
             origin = optimal_route[i]
             dest = optimal_route[i + 1]
 
-            connection = await self.connections_repository.get_connection_by_origin_and_destination_name(
-                origin, dest
-            )
+            connection = edges.get((origin, dest))
             if connection:
                 connections_list.append(connection)
             else:
@@ -159,9 +243,11 @@ class OptimalRouteApplicationService:
             raise ValueError(f"No connections found for route: {optimal_route}")
         
         # Calculate REAL totals from connections (not from algorithm weight)
-        total_distance = sum(conn.distance_km for conn in connections_list)
-        total_time = sum(conn.time_hours for conn in connections_list)
-        total_cost = sum(conn.cost_usd for conn in connections_list)
+        total_distance = total_time = total_cost = 0.0
+        for conn in connections_list:
+            total_distance += conn.distance_km
+            total_time += conn.time_hours
+            total_cost += conn.cost_usd
 
         # NOTE: total_weight from algorithms is their optimization metric,
         # but we always return REAL distance/time/cost values to the user
@@ -182,7 +268,7 @@ class OptimalRouteApplicationService:
             visited_ports=optimal_route
         )
 
-        await self.optimal_route_repository.create(optimal_route_obj)
+        await self.optimal_route_repository.insert(optimal_route_obj)
 
         # ---------------------------------------------------------
         # (7) Return
@@ -24,6 +24,9 @@ class AStarAlgorithm:
         # Name -> [(neighbour, distance_km), ...]
         self.edges = {}
 
+        # Name -> cosine of the port latitude, precomputed for the heuristic
+        self.cos_latitudes = {}
+
     def add_port(self, port, port_name=None):
         """
         Adds a port to the collection of ports and its adjacency list.
@@ -36,6 +39,7 @@ class AStarAlgorithm:
         :param port_name: The name of the port. Defaults to the port's name.
         """
         self.ports[port_name] = port
+        self.cos_latitudes[port_name] = math.cos(math.radians(port.latitude))
         if port_name not in self.edges:
             self.edges[port_name] = []
 
@@ -75,8 +79,8 @@ class AStarAlgorithm:
         # Setting the aproximate Earth radius in km
         earth_radius = 6371  # km
 
-        # Calculating the distance using the Haversine formula
-        phi1, phi2 = math.radians(p1.latitude), math.radians(p2.latitude)
+        # Calculating the distance using the Haversine formula, with the latitude cosines computed when the ports were added
+        cos_phi1, cos_phi2 = self.cos_latitudes[current_node], self.cos_latitudes[destination_node]
 
         # Finds the delta pi by subtracting the latitudes
         delta_phi = math.radians(p2.latitude - p1.latitude)
@@ -85,7 +89,7 @@ class AStarAlgorithm:
         delta_lambda = math.radians(p2.longitude - p1.longitude)
 
         # Calculates the Haversine formula
-        a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+        a = math.sin(delta_phi / 2) ** 2 + cos_phi1 * cos_phi2 * math.sin(delta_lambda / 2) ** 2
 
         # Calculates the final distance
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
@@ -84,8 +84,15 @@ class BellmanFordAlgorithm:
         if self.ports[destination].capacity < export_weight:
             return float('inf'), []
 
+        inf = float('inf')
+
+        # Keeps only the edges whose destination port has enough capacity for the export weight,
+        # so the check is done once per edge instead of once per edge and iteration
+        ports = self.ports
+        edges = [(u, v, w) for u, v, w in self.edges if ports[v].capacity >= export_weight]
+
         # Initializes the distance from the origin to each node as a positive infinity value
-        dist = {n: float('inf') for n in self.ports}
+        dist = {n: inf for n in ports}
 
         # Sets the distance from the origin to itself to 0
         dist[origin] = 0
@@ -93,21 +100,17 @@ class BellmanFordAlgorithm:
         # Initializes the node we came from to reconstruct the path later
         came_from = {}
 
-        for _ in range(len(self.ports) - 1):
+        for _ in range(len(ports) - 1):
             # Sets a flag to indicate if any change was made during the iteration
             updated = False
 
             # For each edge in the graph
-            for u, v, w in self.edges:
-
-                # If the neighbor port has not enough capacity for the export weight, skip it
-                if self.ports[v].capacity < export_weight:
-                    continue
-
+            for u, v, w in edges:
                 # If the distance from the current node to the neighbor is lower than the
                 # current distance, update the distance and the node we came from
-                if dist[u] != float('inf') and dist[u] + w < dist[v]:
-                    dist[v] = dist[u] + w
+                dist_u = dist[u]
+                if dist_u != inf and dist_u + w < dist[v]:
+                    dist[v] = dist_u + w
                     came_from[v] = u
                     updated = True
 
@@ -116,15 +119,12 @@ class BellmanFordAlgorithm:
                 break
 
         # Check for negative weight cycles
-        for u, v, w in self.edges:
-            if self.ports[v].capacity < export_weight:
-                continue
-
-            if dist[u] != float('inf') and dist[u] + w < dist[v]:
+        for u, v, w in edges:
+            if dist[u] != inf and dist[u] + w < dist[v]:
                 raise Exception("WARNING: Negative weight cycle detected!")
 
         # If the destination is unreachable, return infinity and an empty route list
-        if dist[destination] == float('inf'):
+        if dist[destination] == inf:
             return float('inf'), []
 
         # Build the route from origin to destination
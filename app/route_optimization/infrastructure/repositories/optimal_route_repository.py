@@ -1,5 +1,7 @@
-﻿from sqlalchemy.ext.asyncio import AsyncSession
+﻿from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.export_management.infrastructure.models.export_model import ExportModel
 from app.route_optimization.domain.models.optimal_route import OptimalRoute
 from app.route_optimization.infrastructure.models.optimal_route_model import OptimalRouteModel
 from app.shared.infrastructure.repositories.base_repository import BaseRepository
@@ -73,4 +75,37 @@ class OptimalRouteRepository(BaseRepository[OptimalRoute, OptimalRouteModel]):
             total_distance=model.total_distance,
             total_time=model.total_time,
             visited_ports=model.visited_ports
-        )
\ No newline at end of file
+        )
+
+    async def insert(self, entity: OptimalRoute) -> None:
+        """
+        Persists a new optimal route without reading it back.
+
+        Unlike `create`, the row is not refreshed after the commit, since the entity already
+        holds every stored value. This saves a round trip on the route computation path.
+
+        :param entity: The OptimalRoute entity to persist.
+        :type entity: OptimalRoute
+        """
+        self._db.add(self.to_model(entity))
+        await self._db.commit()
+
+    async def get_by_export_id(self, export_id: str) -> "OptimalRoute | None":
+        """
+        Retrieves the optimal route assigned to an export.
+
+        The export and its route are joined in a single query, so the export does not
+        need to be loaded first.
+
+        :param export_id: The unique identifier of the export.
+        :type export_id: str
+        :return: The optimal route of the export if found, otherwise None.
+        :rtype: OptimalRoute | None
+        """
+        result = await self._db.execute(
+            select(OptimalRouteModel)
+            .join(ExportModel, ExportModel.optimized_route_id == OptimalRouteModel.id)
+            .where(ExportModel.id == export_id)
+        )
+        model = result.scalar_one_or_none()
+        return self.to_entity(model) if model else None
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 import uuid
 from datetime import datetime
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BaseEntity:
     """
     Base entity class to be inherited by all entities.
@@ -0,0 +1,15 @@
+﻿"""
+Validation helpers shared by the domain services.
+"""
+
+
+def is_blank(value: str | None) -> bool:
+    """
+    Checks whether a string is missing, empty or only contains whitespace, without allocating a stripped copy.
+
+    Only None and strings can be blank, so other falsy values such as 0 are not reported as empty.
+
+    :param value: The value to check.
+    :return: True if the value is None, empty or only whitespace, otherwise False.
+    """
+    return value is None or (isinstance(value, str) and (not value or value.isspace()))
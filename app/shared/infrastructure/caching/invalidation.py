@@ -0,0 +1,32 @@
+﻿"""
+Invalidation hooks for the in-process caches derived from ports and port connections.
+
+The bounded contexts that cache data built from the port network register a listener here,
+and the port management context notifies them after every change, so neither context has to
+import the other's application layer.
+"""
+from typing import Callable
+
+# Listeners called after any change to ports or port connections
+_port_network_listeners: list[Callable[[], None]] = []
+
+
+def on_port_network_change(listener: Callable[[], None]) -> Callable[[], None]:
+    """
+    Registers a listener to be called after any change to ports or port connections.
+
+    :param listener: A callable without arguments, usually clearing a cache.
+    :return: The same listener, so it can be used as a decorator.
+    """
+    _port_network_listeners.append(listener)
+    return listener
+
+
+def notify_port_network_changed() -> None:
+    """
+    Calls every registered listener.
+
+    Must be called after any change to ports or port connections.
+    """
+    for listener in _port_network_listeners:
+        listener()
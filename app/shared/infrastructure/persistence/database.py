@@ -1,16 +1,15 @@
 """
 Database initialization and connection management for the BerrySend API.
 """
-from sqlalchemy import text, create_engine
+import asyncio
+
+from sqlalchemy import text, create_engine, inspect
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-from app.config import settings
+from app.config import get_settings
 from app.shared.infrastructure.models.base_model import BaseModelORM
 
-# Database base URL for connection
-DATABASE_URL: str = str(settings.database_url())
-
 # Base variable for SQLAlchemy
 Base = declarative_base()
 
@@ -22,7 +21,8 @@ async def create_tables():
     This function imports all ORM models to ensure they are registered with
     BaseModelORM.metadata, then creates all tables using SQLAlchemy's create_all method.
     It uses a synchronous engine for table creation as create_all works better
-    with synchronous engines.
+    with synchronous engines. The existing tables are read once and only the missing
+    ones are created, all over a single connection and transaction.
     
     :exception Exception: If there is an error creating the tables.
     """
@@ -34,11 +34,19 @@ async def create_tables():
 
         # Create a synchronous engine for table creation
         # (create_all works better with sync engines)
-        sync_url = DATABASE_URL.replace("+aiomysql", "").replace("mysql+aiomysql://", "mysql+pymysql://")
+        database_url = get_settings().database_url()
+        sync_url = database_url.replace("+aiomysql", "").replace("mysql+aiomysql://", "mysql+pymysql://")
         sync_engine = create_engine(sync_url, echo=False)
 
-        # Create all tables
-        BaseModelORM.metadata.create_all(bind=sync_engine)
+        # Create only the missing tables, reusing one connection for the whole bootstrap
+        with sync_engine.begin() as conn:
+            existing_tables = set(inspect(conn).get_table_names())
+            missing_tables = [
+                table for table in BaseModelORM.metadata.sorted_tables
+                if table.name not in existing_tables
+            ]
+            if missing_tables:
+                BaseModelORM.metadata.create_all(bind=conn, tables=missing_tables, checkfirst=False)
         sync_engine.dispose()
 
         print("Database tables created successfully.")
@@ -57,7 +65,7 @@ class Database:
         Initialize the database connection.
 
         """
-        self.db_name = str(settings.MYSQL_DB)
+        self.db_name = str(get_settings().MYSQL_DB)
         self.engine = None
         self.SessionLocal = None
         self.session = None
@@ -66,36 +74,27 @@ class Database:
         """
         Checks if the database exists and creates it if it doesn't.
         
-        This method connects to the MySQL server without specifying a database,
-        checks if the target database exists by querying information_schema,
-        and creates it if it doesn't exist.
+        This method connects to the MySQL server without specifying a database
+        and issues a single CREATE DATABASE IF NOT EXISTS statement, so checking and
+        creating the database takes one round-trip.
         
         :exception Exception: If there is an error checking or creating the database.
         """
         try:
             # Build connection URL without the database name to connect to MySQL server
             # Remove the database name from the URL
-            url_without_db = DATABASE_URL.replace("+aiomysql", "").rsplit("/", 1)[0]
+            url_without_db = get_settings().database_url().replace("+aiomysql", "").rsplit("/", 1)[0]
             
             # Connect to MySQL server (without specifying a database)
             engine_tmp = create_engine(url_without_db, echo=False)
             
-            with engine_tmp.connect() as conn:
-                # Check if the database exists
-                result = conn.execute(
-                    text(
-                        "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = :db_name"
-                    ),
-                    {"db_name": self.db_name}
-                )
-                db_exists = result.fetchone() is not None
-                
-                if db_exists:
+            with engine_tmp.begin() as conn:
+                # Create the database if it doesn't exist (MySQL reports 0 affected rows when it exists)
+                result = conn.execute(text(f"CREATE DATABASE IF NOT EXISTS `{self.db_name}`"))
+
+                if result.rowcount == 0:
                     print(f"The database '{self.db_name}' already exists.")
                 else:
-                    # Create the database if it doesn't exist
-                    conn.execute(text(f"CREATE DATABASE `{self.db_name}`"))
-                    conn.commit()
                     print(f"The database '{self.db_name}' has been created successfully.")
             
             engine_tmp.dispose()
@@ -108,8 +107,17 @@ class Database:
         Connects to the database and creates the database connection.
 
         """
+        settings = get_settings()
         self.create_database_if_not_exists()
-        self.engine = create_async_engine(DATABASE_URL, echo=False)
+        self.engine = create_async_engine(
+            settings.database_url(),
+            echo=False,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE
+        )
         self.SessionLocal = sessionmaker( # type: ignore[arg-type]
             bind=self.engine,
             class_=AsyncSession,
@@ -119,6 +127,19 @@ class Database:
         )
         print(f"Connected to the database: '{self.db_name}'.")
 
+    async def warm_up_pool(self):
+        """
+        Opens the pool connections ahead of time so the first requests don't pay the connection handshake.
+
+        SQLAlchemy doesn't have a minimum pool size option, so this checks out `DB_POOL_SIZE`
+        connections at once and returns them to the pool.
+        """
+        async def open_connection():
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(open_connection() for _ in range(get_settings().DB_POOL_SIZE)))
+
     async def __aenter__(self):
         """
         Enters the context manager.
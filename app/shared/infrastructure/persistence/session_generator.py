@@ -2,23 +2,32 @@
 Global session generator for injecting to the repositories
 """
 from typing import AsyncGenerator
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
-# Import the db_instance from the main file instead of creating a new one
-def get_db_instance():
-    """Lazy import to avoid circular dependencies"""
-    from main import db_instance
-    return db_instance
+async def get_session_factory(request: Request) -> sessionmaker:
+    """
+    Gets the session factory of the database instance stored in the application state.
+
+    :param request: The current request.
+    :return: The session factory bound to the application's engine.
+    """
+    return request.app.state.db.SessionLocal
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(session_factory: sessionmaker = Depends(get_session_factory)) -> AsyncGenerator[AsyncSession, None]:
     """
     Gets the database session.
 
+    The session is rolled back if the request fails and is always closed afterward,
+    so its connection goes back to the pool on both the success and error paths.
+
+    :param session_factory: The session factory bound to the application's engine.
     :return: The async session.
     """
-    db = get_db_instance()
-    async with db.SessionLocal() as session:
+    async with session_factory() as session:
         try:
             yield session
-        finally:
-            await session.close()
\ No newline at end of file
+        except Exception:
+            await session.rollback()
+            raise
\ No newline at end of file
@@ -21,6 +21,9 @@ class BaseRepository(Generic[TEntity, TModel]):
     Base repository class for generic CRUD operations.
 
     """
+    # Repositories are created on every request, so they hold no per-instance dict
+    __slots__ = ("_db", "_model")
+
     def __init__(self, db: AsyncSession, model: Type[TModel]):
         """
         Method to initialize the repository.
@@ -69,7 +72,7 @@ class BaseRepository(Generic[TEntity, TModel]):
         :param entity: The entity to be updated.
         :return: The updated entity.
         """
-        entity.updated_date = datetime.now
+        entity.updated_at = datetime.now()
         model = self.to_model(entity)
         merged = await self._db.merge(model)
         await self._db.commit()
@@ -80,13 +83,13 @@ class BaseRepository(Generic[TEntity, TModel]):
         """
         Method to get an entity by its id.
 
+        The lookup goes through the session's identity map first, so a model already
+        loaded in the current session is returned without querying the database.
+
         :param identifier: The id of the entity.
         :return: The entity with the given id, if found, otherwise None.
         """
-        result: Result = await self._db.execute(
-            select(self._model).where(self._model.id == identifier)
-        )
-        model = result.scalar_one_or_none()
+        model = await self._db.get(self._model, identifier)
         return self.to_entity(model) if model else None
 
     async def get_all(self) -> list[TEntity]:
@@ -2,16 +2,20 @@
 Main initialization for the API
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 
 from app.port_management.application.port_application_service import PortApplicationService
 from app.port_management.application.port_connection_application_service import PortConnectionApplicationService
 
 from app.shared.infrastructure.persistence.database import Database, create_tables
-from app.config import settings
+from app.config import get_settings
+from app.shared.infrastructure.middleware.etag_middleware import ETagMiddleware
+from app.iam.infrastructure.hashing.hashing_service import HashingService
 from app.port_management.interfaces.controllers.ports_router import router as ports_router
 from app.port_management.interfaces.controllers.port_connections_router import router as connections_router
 from app.iam.interfaces.controllers.auth_controller import auth_router
@@ -39,12 +43,30 @@ async def lifespan(_app: FastAPI):
     print("Starting the application...")
 
     db_instance.connect()
+    _app.state.db = db_instance
     print("Database connection established...")
 
+    # Open the pool connections before serving requests
+    await db_instance.warm_up_pool()
+    print("Database connection pool ready...")
+
     # Create all tables if they don't exist
     await create_tables()
     print("Database tables ready...")
 
+    # Configure the bcrypt cost factor once for the process
+    settings = get_settings()
+    HashingService.ROUNDS = settings.BCRYPT_ROUNDS
+    if settings.BCRYPT_TARGET_MS > 0:
+        HashingService.ROUNDS = HashingService.calibrate_rounds(settings.BCRYPT_TARGET_MS)
+    # Create the dummy hash now, so the first sign-in with an unknown email isn't slower than the rest
+    await HashingService.dummy_hash_async()
+    print(f"Password hashing ready with {HashingService.ROUNDS} bcrypt rounds...")
+
+    # Build the OpenAPI schema (and every model's JSON schema) before serving requests
+    _app.openapi()
+    print("OpenAPI schema ready...")
+
     # Seed the CSV files into the database
     async with db_instance.SessionLocal() as session:
         port_app_service = PortApplicationService(session)
@@ -86,7 +108,9 @@ app = FastAPI(
     title="BerrySend Backend",
     description="API to register exports of blue berries anc calculate the shortest route",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Responses built from return values are encoded with orjson instead of the standard json module
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -108,6 +132,18 @@ app.add_middleware(
     allow_headers=["*"],  # Authorization, Content-Type, etc.
 )
 
+# Answer repeated port reads with 304 Not Modified when the client's copy is current
+app.add_middleware(ETagMiddleware, path_prefixes=("/api/v1/ports",))
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """
+    Returns the default 422 response, marked as not cacheable so malformed requests are not replayed.
+    """
+    response = await request_validation_exception_handler(request, exc)
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
 @app.get("/health")
 async def health_check():
     """Check if the database and tables are ready"""